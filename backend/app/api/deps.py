@@ -3,33 +3,45 @@
 """
 Dependency providers for FastAPI routes.
 
-Provides cached singleton instances of:
+Provides singleton instances of:
 - SettingsManager: for accessing application configuration
 - ConnectionRuntimeManager: for managing connection worker lifecycles
 
+The managers are created once by `init_managers()` (called from the app
+lifespan) and then returned by plain module-level reads, so route
+dependencies do not pay any locking or cache lookup per request.
+
 These functions are used with FastAPI's `Depends` system to inject
 global managers into route handlers.
 """
 
-from functools import lru_cache
+import threading
+from dataclasses import dataclass
+from typing import Optional
 
 from backend.app.config import config
 from backend.app.core.settings_manager import SettingsManager
 from backend.app.loggers.manager import ConnectionRuntimeManager
 
 
-@lru_cache()
-def get_settings_manager() -> SettingsManager:
+@dataclass(slots=True, frozen=True)
+class AppDeps:
     """
-    Returns a singleton instance of SettingsManager.
+    Both global managers, injected with a single Depends(get_deps).
     """
-    return SettingsManager(config.SETTINGS_FILE)
+    settings: SettingsManager
+    runtime: ConnectionRuntimeManager
 
 
-@lru_cache()
-def get_runtime_manager() -> ConnectionRuntimeManager:
+_SETTINGS: Optional[SettingsManager] = None
+_RUNTIME: Optional[ConnectionRuntimeManager] = None
+_DEPS: Optional[AppDeps] = None
+_init_lock = threading.Lock()
+
+
+def _build_runtime_manager(settings_manager: SettingsManager) -> ConnectionRuntimeManager:
     """
-    Global runtime manager.
+    Creates the global runtime manager.
 
     On initialization:
       - is created with base database settings;
@@ -37,15 +49,77 @@ def get_runtime_manager() -> ConnectionRuntimeManager:
       - automatically starts only those connections
         with autostart = True.
     """
-    settings_manager = get_settings_manager()
     base_db_settings = settings_manager.get_db_settings()
     manager = ConnectionRuntimeManager(base_db_settings=base_db_settings)
 
-    # Autostart loggers
-    for conn in settings_manager.get_connections():
-        # Register all connections so they can be started manually via the API later
-        worker = manager.register_connection(conn)
-        if conn.autostart:
-            manager.start_connection(conn.id)
+    # Autostart loggers; any settings writes made meanwhile are flushed once
+    with settings_manager.batch_updates():
+        for conn in settings_manager.get_connections():
+            # Register all connections so they can be started manually via the API later
+            manager.register_connection(conn)
+            if conn.autostart:
+                manager.start_connection(conn.id)
 
     return manager
+
+
+def init_managers() -> ConnectionRuntimeManager:
+    """
+    Creates the settings and runtime managers if they do not exist yet.
+
+    Safe to call more than once; returns the runtime manager.
+    """
+    global _SETTINGS, _RUNTIME, _DEPS
+    with _init_lock:
+        if _SETTINGS is None:
+            _SETTINGS = SettingsManager(config.SETTINGS_FILE)
+        if _RUNTIME is None:
+            _RUNTIME = _build_runtime_manager(_SETTINGS)
+        if _DEPS is None:
+            _DEPS = AppDeps(settings=_SETTINGS, runtime=_RUNTIME)
+        return _RUNTIME
+
+
+def reset_managers() -> None:
+    """
+    Drops the current managers so the next `init_managers()` builds new ones.
+
+    Used before restarting the server from the tray.
+    """
+    global _SETTINGS, _RUNTIME, _DEPS
+    with _init_lock:
+        _SETTINGS = None
+        _RUNTIME = None
+        _DEPS = None
+
+
+def get_settings_manager() -> SettingsManager:
+    """
+    Returns a singleton instance of SettingsManager.
+    """
+    manager = _SETTINGS
+    if manager is None:
+        init_managers()
+        manager = _SETTINGS
+    return manager
+
+
+def get_runtime_manager() -> ConnectionRuntimeManager:
+    """
+    Returns the global runtime manager.
+    """
+    manager = _RUNTIME
+    if manager is None:
+        manager = init_managers()
+    return manager
+
+
+def get_deps() -> AppDeps:
+    """
+    Returns both managers for routes that need settings and runtime state.
+    """
+    deps = _DEPS
+    if deps is None:
+        init_managers()
+        deps = _DEPS
+    return deps
@@ -12,9 +12,7 @@ Responsibilities:
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from backend.app.api.deps import get_settings_manager, get_runtime_manager
-from backend.app.core.settings_manager import SettingsManager
-from backend.app.loggers.manager import ConnectionRuntimeManager
+from backend.app.api.deps import AppDeps, get_deps
 from backend.app.schemas.connection_logs import (
     ConnectionLogs,
     ConnectionLogsResponse,
@@ -31,8 +29,7 @@ router = APIRouter()
 )
 def get_connection_logs(
     conn_id: int,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
     messages_limit: int = 100,
     errors_limit: int = 50,
 ) -> ConnectionLogsResponse:
@@ -43,6 +40,7 @@ def get_connection_logs(
 
     If the worker has never been started, messages and errors are empty.
     """
+    settings_manager, runtime_manager = deps.settings, deps.runtime
 
     # 1. Ensure the connection configuration exists
     conn = settings_manager.get_connection(conn_id)
@@ -68,18 +66,7 @@ def get_connection_logs(
         return ConnectionLogsResponse(success=True, data=logs)
 
     # 3. Worker exists (running or stopped): extract buffered logs
-    all_messages = worker.recent_messages
-    all_errors = worker.recent_errors
-
-    if messages_limit > 0:
-        messages = all_messages[-messages_limit:]
-    else:
-        messages = all_messages
-
-    if errors_limit > 0:
-        errors = all_errors[-errors_limit:]
-    else:
-        errors = all_errors
+    messages, errors = worker.snapshot_logs(messages_limit, errors_limit)
 
     logs = ConnectionLogs(
         conn_id=conn_id,
@@ -99,9 +86,9 @@ def get_connection_logs(
 )
 def get_connection_metrics(
     conn_id: int,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ):
+    settings_manager, runtime_manager = deps.settings, deps.runtime
     # Ensure the connection configuration exists
     conn = settings_manager.get_connection(conn_id)
     if conn is None:
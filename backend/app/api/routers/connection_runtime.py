@@ -14,12 +14,14 @@ Uses:
 - ConnectionRuntimeManager to manage worker threads and states
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from backend.app.api.deps import get_settings_manager, get_runtime_manager
+from backend.app.api.deps import AppDeps, get_deps
 from backend.app.core.settings_manager import SettingsManager
-from backend.app.loggers.manager import ConnectionRuntimeManager
-from backend.app.loggers.base import WorkerState
+from backend.app.loggers.base import BaseConnectionWorker, WorkerState
+from backend.app.loggers.models import LoggerConnectionConfig
 from backend.app.schemas.connection_runtime import (
     ConnectionRuntimeStatus,
     ConnectionRuntimeStatusResponse,
@@ -28,11 +30,7 @@ from backend.app.schemas.connection_runtime import (
 router = APIRouter()
 
 
-def _build_status(
-    conn_id: int,
-    settings_manager: SettingsManager,
-    runtime_manager: ConnectionRuntimeManager,
-) -> ConnectionRuntimeStatus:
+def _get_connection_or_404(conn_id: int, settings_manager: SettingsManager) -> LoggerConnectionConfig:
     # Connection configuration loaded from JSON
     conn = settings_manager.get_connection(conn_id)
     if conn is None:
@@ -40,14 +38,19 @@ def _build_status(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Connection id {conn_id} not found",
         )
+    return conn
 
-    worker = runtime_manager.get_worker(conn_id)
+
+def _build_status(
+    conn: LoggerConnectionConfig,
+    worker: Optional[BaseConnectionWorker],
+) -> ConnectionRuntimeStatus:
     registered = worker is not None
-    state: WorkerState | None = runtime_manager.get_state(conn_id) if registered else None
-    last_error = worker.last_error if worker is not None else None
+    state: WorkerState | None = worker.state if registered else None
+    last_error = worker.last_error if registered else None
 
     return ConnectionRuntimeStatus(
-        conn_id=conn_id,
+        conn_id=conn.id,
         name=conn.name,
         enabled=conn.enabled,
         registered=registered,
@@ -63,10 +66,11 @@ def _build_status(
 )
 def get_connection_status(
     conn_id: int,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ) -> ConnectionRuntimeStatusResponse:
-    status_obj = _build_status(conn_id, settings_manager, runtime_manager)
+    settings_manager, runtime_manager = deps.settings, deps.runtime
+    conn = _get_connection_or_404(conn_id, settings_manager)
+    status_obj = _build_status(conn, runtime_manager.get_worker(conn_id))
     return ConnectionRuntimeStatusResponse(success=True, data=status_obj)
 
 
@@ -77,19 +81,14 @@ def get_connection_status(
 )
 def start_connection(
     conn_id: int,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ) -> ConnectionRuntimeStatusResponse:
+    settings_manager, runtime_manager = deps.settings, deps.runtime
     # Retrieve connection configuration
-    conn = settings_manager.get_connection(conn_id)
-    if conn is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Connection id {conn_id} not found",
-        )
+    conn = _get_connection_or_404(conn_id, settings_manager)
 
     # Register the connection (create worker if it does not exist yet)
-    runtime_manager.register_connection(conn)
+    worker = runtime_manager.register_connection(conn)
 
     # Start the worker
     try:
@@ -101,7 +100,7 @@ def start_connection(
             error=f"Connection id {conn_id} is not registered in runtime manager",
         )
 
-    status_obj = _build_status(conn_id, settings_manager, runtime_manager)
+    status_obj = _build_status(conn, worker)
     return ConnectionRuntimeStatusResponse(success=True, data=status_obj)
 
 
@@ -112,21 +111,16 @@ def start_connection(
 )
 def stop_connection(
     conn_id: int,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ) -> ConnectionRuntimeStatusResponse:
+    settings_manager, runtime_manager = deps.settings, deps.runtime
     # First, ensure the connection configuration exists
-    conn = settings_manager.get_connection(conn_id)
-    if conn is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Connection id {conn_id} not found",
-        )
+    conn = _get_connection_or_404(conn_id, settings_manager)
 
     # stop_connection is safe: if no worker exists, it simply returns
     runtime_manager.stop_connection(conn_id)
 
-    status_obj = _build_status(conn_id, settings_manager, runtime_manager)
+    status_obj = _build_status(conn, runtime_manager.get_worker(conn_id))
     return ConnectionRuntimeStatusResponse(success=True, data=status_obj)
 
 
@@ -139,18 +133,13 @@ def stop_connection(
 )
 def restart_connection(
     conn_id: int,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ) -> ConnectionRuntimeStatusResponse:
-    conn = settings_manager.get_connection(conn_id)
-    if conn is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Connection id {conn_id} not found",
-        )
+    settings_manager, runtime_manager = deps.settings, deps.runtime
+    conn = _get_connection_or_404(conn_id, settings_manager)
 
     # If the worker has not been registered yet, register it first
-    runtime_manager.register_connection(conn)
+    worker = runtime_manager.register_connection(conn)
 
     # 1) Gracefully stop the worker
     runtime_manager.stop_connection(conn_id)
@@ -161,6 +150,6 @@ def restart_connection(
     # 3) Start the worker again
     runtime_manager.start_connection(conn_id)
 
-    status_obj = _build_status(conn_id, settings_manager, runtime_manager)
+    status_obj = _build_status(conn, worker)
     return ConnectionRuntimeStatusResponse(success=True, data=status_obj)
 
@@ -14,10 +14,9 @@ from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from backend.app.api.deps import get_settings_manager, get_runtime_manager
+from backend.app.api.deps import AppDeps, get_deps, get_settings_manager
 from backend.app.core.settings_manager import SettingsManager, ConnectionNameAlreadyExistsError
 from backend.app.loggers.models import LoggerConnectionConfig
-from backend.app.loggers.manager import ConnectionRuntimeManager
 from backend.app.loggers.base import WorkerState
 from backend.app.schemas.connections import (
     ConnectionCreateRequest,
@@ -55,8 +54,7 @@ def get_connection(
 @router.post("/", response_model=ConnectionResponse)
 def create_connection(
     payload: ConnectionCreateRequest,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ) -> LoggerConnectionConfig:
     """
     Creates a new logger/connection configuration.
@@ -64,8 +62,8 @@ def create_connection(
     Note:
     - ID from the payload is ignored; it will be assigned on the backend.
     """
-    data = payload.model_copy()
-    data.id = None
+    settings_manager, runtime_manager = deps.settings, deps.runtime
+    data = payload.model_copy(update={"id": None})
 
     try:
         created = settings_manager.upsert_connection(data)
@@ -86,8 +84,7 @@ def create_connection(
 def update_connection(
     conn_id: int,
     payload: ConnectionUpdateRequest,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ) -> LoggerConnectionConfig:
     """
     Updates a logger/connection configuration by ID.
@@ -98,6 +95,7 @@ def update_connection(
       - Register a new worker with the updated configuration
       - Start it if previously RUNNING or if autostart=True
     """
+    settings_manager, runtime_manager = deps.settings, deps.runtime
     existing = settings_manager.get_connection(conn_id)
     if existing is None:
         raise HTTPException(status_code=404, detail="Connection not found")
@@ -105,8 +103,7 @@ def update_connection(
     # Remember previous state (if worker exists)
     prev_state = runtime_manager.get_state(conn_id)
 
-    data = payload.model_copy()
-    data.id = conn_id
+    data = payload.model_copy(update={"id": conn_id})
 
     try:
         updated = settings_manager.upsert_connection(data)
@@ -135,8 +132,7 @@ def update_connection(
 @router.delete("/{conn_id}")
 def delete_connection(
     conn_id: int,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ):
     """
     Deletes a logger/connection configuration by ID.
@@ -146,6 +142,7 @@ def delete_connection(
       - Waits for shutdown completion
       - Unregisters the worker from runtime manager
     """
+    settings_manager, runtime_manager = deps.settings, deps.runtime
     # Stop and remove runtime worker first
     runtime_manager.stop_connection(conn_id)
     runtime_manager.join_connection(conn_id, timeout=5.0)
@@ -10,6 +10,9 @@ Responsibilities:
 - Return parsed variables or errors
 """
 
+import threading
+from typing import Dict, Optional, Tuple
+
 from fastapi import APIRouter
 
 from backend.app.schemas.easy_serial_parser import EasySerialParserTestRequest, EasySerialParserTestResponse
@@ -19,6 +22,31 @@ from backend.app.loggers.easy_serial.framer import decode_escaped_bytes
 
 router = APIRouter()
 
+_FRAMER_CACHE_MAX = 64
+
+# Framers are stateful, so each threadpool worker keeps its own cache
+_framers = threading.local()
+
+
+def _get_framer(preamble: Optional[str], terminator: str) -> EasySerialFramer:
+    """
+    Returns an empty framer for (preamble, terminator), reusing one built
+    earlier by the same thread.
+    """
+    cache: Optional[Dict[Tuple[Optional[str], str], EasySerialFramer]] = getattr(_framers, "cache", None)
+    if cache is None:
+        cache = _framers.cache = {}
+
+    key = (preamble, terminator)
+    framer = cache.get(key)
+    if framer is None:
+        if len(cache) >= _FRAMER_CACHE_MAX:
+            cache.clear()
+        framer = cache[key] = EasySerialFramer(preamble=preamble, terminator=terminator)
+    else:
+        framer.reset()
+    return framer
+
 
 @router.post("/parser/test", response_model=EasySerialParserTestResponse)
 def test_easy_serial_parser(req: EasySerialParserTestRequest):
@@ -32,9 +60,9 @@ def test_easy_serial_parser(req: EasySerialParserTestRequest):
     """
     try:
         # 1. Feed raw bytes through the framer
-        framer = EasySerialFramer(
-            preamble=req.parser_settings.preamble,
-            terminator=req.parser_settings.terminator,
+        framer = _get_framer(
+            req.parser_settings.preamble,
+            req.parser_settings.terminator,
         )
 
         raw_bytes = decode_escaped_bytes(req.raw_text)
@@ -13,9 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from typing import Set, Tuple, List, Optional
 from pydantic import BaseModel
 
-from backend.app.api.deps import get_settings_manager, get_runtime_manager
-from backend.app.core.settings_manager import SettingsManager
-from backend.app.loggers.manager import ConnectionRuntimeManager
+from backend.app.api.deps import AppDeps, get_deps
 from backend.app.loggers.models import ConnectionType
 
 
@@ -48,8 +46,7 @@ class AvailableCountersResponse(BaseModel):
 def send_mbox_start_command(
     conn_id: int,
     payload: MboxStartCommandRequest,
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ): 
     """
     Sends a start command to an MBox connection.
@@ -60,6 +57,7 @@ def send_mbox_start_command(
       - Ensures worker supports start command
       - Executes command and handles errors
     """
+    settings_manager, runtime_manager = deps.settings, deps.runtime
     conn = settings_manager.get_connection(conn_id)
     if conn is None:
         raise HTTPException(status_code=404, detail="Connection not found")
@@ -91,8 +89,7 @@ def send_mbox_start_command(
     summary="List available mbox_counter devices for selection",
 )
 def get_available_mbox_counters(
-    settings_manager: SettingsManager = Depends(get_settings_manager),
-    runtime_manager: ConnectionRuntimeManager = Depends(get_runtime_manager),
+    deps: AppDeps = Depends(get_deps),
 ) -> AvailableCountersResponse:
     """
     Returns a list of available mbox_counter devices that are not currently assigned.
@@ -102,13 +99,20 @@ def get_available_mbox_counters(
       - Scans all mbox_counter connections for enabled, free devices
       - Optionally includes runtime state and total count
     """
+    settings_manager, runtime_manager = deps.settings, deps.runtime
     all_conns = settings_manager.get_connections()
 
-    # 1) Collect set of occupied (counter_connection_id, device_id)
+    # 1) Single pass: collect occupied (counter_connection_id, device_id)
+    #    pairs and the mbox_counter connections to scan
     bound: Set[Tuple[int, int]] = set()
+    counter_conns = []
     for c in all_conns:
         if c.id is None:
             continue
+        if c.type == ConnectionType.mbox_counter:
+            if c.mbox_counter is not None:
+                counter_conns.append(c)
+            continue
         if c.type != ConnectionType.mbox or c.mbox is None:
             continue
         if not c.mbox.ext_counter:
@@ -122,37 +126,33 @@ def get_available_mbox_counters(
 
         bound.add((ccid, did))
 
-    # 2) Collect free devices from all mbox_counter connections
+    # 2) Collect free devices from the mbox_counter connections
     out: List[AvailableCounterItem] = []
+    get_worker = runtime_manager.get_worker
+    get_counter_total_getter = runtime_manager.get_counter_total_getter
 
-    for c in all_conns:
-        if c.id is None:
-            continue
-        if c.type != ConnectionType.mbox_counter or c.mbox_counter is None:
-            continue
-
-        worker = runtime_manager.get_worker(c.id)
+    for c in counter_conns:
+        conn_id = c.id
+        worker = get_worker(conn_id)
         runtime_state = worker.state.value if worker is not None else None
+        get_total = get_counter_total_getter(conn_id) if worker is not None else None
 
         for dev in c.mbox_counter.devices:
             if not dev.enabled:
                 continue
-            key = (c.id, dev.device_id)
-            if key in bound:
+            if (conn_id, dev.device_id) in bound:
                 continue
 
             total_count: Optional[int] = None
-            if worker is not None:
-                get_total = getattr(worker, "get_total", None)
-                if callable(get_total):
-                    try:
-                        total_count = get_total(dev.device_id)
-                    except Exception:
-                        total_count = None
+            if get_total is not None:
+                try:
+                    total_count = get_total(dev.device_id)
+                except Exception:
+                    total_count = None
 
             out.append(
                 AvailableCounterItem(
-                    counter_connection_id=c.id,
+                    counter_connection_id=conn_id,
                     counter_connection_name=c.name,
                     device_id=dev.device_id,
                     device_name=dev.name,
@@ -8,6 +8,13 @@ Responsibilities:
 - Determine port availability by attempting to open it
 """
 
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
 from fastapi import APIRouter
 from serial.tools import list_ports
 
@@ -16,13 +23,141 @@ import serial
 
 router = APIRouter()
 
+# Probe results are reused for a short time so a polling UI does not
+# re-open every port on each request.
+_PROBE_TTL = 2.0
+_PROBE_CACHE_MAX = 64
+
+# port name -> (expires_at, is_free)
+_probe_cache: dict[str, tuple[float, bool]] = {}
+_probe_cache_lock = threading.Lock()
+# Per-port probe serialization uses a fixed set of striped locks, so no
+# per-name state accumulates for ports that come and go
+_PROBE_LOCK_STRIPES = 16
+_probe_key_locks = tuple(threading.Lock() for _ in range(_PROBE_LOCK_STRIPES))
+
+# On Windows the port list is reused while the registry reports the same
+# port names, but never for longer than this (description/hwid changes)
+_PORTS_MAX_AGE = 30.0
+
+# (built_at, port names seen in the registry or None, comports() result)
+_ports_cache: tuple[float, frozenset[str] | None, list] | None = None
+_ports_cache_lock = threading.Lock()
+
+
+def _get_cached_probe(name: str) -> bool | None:
+    entry = _probe_cache.get(name)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def _probe_port_cached(name: str) -> bool:
+    """
+    Returns `_is_port_free(name)`, reusing a result younger than _PROBE_TTL.
+
+    Concurrent requests for the same port wait on the port's (striped)
+    lock, so only one of them actually opens the device.
+    """
+    cached = _get_cached_probe(name)
+    if cached is not None:
+        return cached
+
+    key_lock = _probe_key_locks[hash(name) % _PROBE_LOCK_STRIPES]
+    with key_lock:
+        cached = _get_cached_probe(name)
+        if cached is not None:
+            return cached
+
+        is_free = _is_port_free(name)
+
+        with _probe_cache_lock:
+            if len(_probe_cache) >= _PROBE_CACHE_MAX:
+                now = time.monotonic()
+                for key in [k for k, (exp, _) in _probe_cache.items() if exp < now]:
+                    del _probe_cache[key]
+                if len(_probe_cache) >= _PROBE_CACHE_MAX:
+                    _probe_cache.clear()
+            _probe_cache[name] = (time.monotonic() + _PROBE_TTL, is_free)
+
+        return is_free
+
+
+def _registry_port_names() -> frozenset[str] | None:
+    """
+    Reads COM port names from HKLM\\HARDWARE\\DEVICEMAP\\SERIALCOMM.
+
+    This is a cheap registry read, unlike the setupapi walk done by
+    comports(). Returns None on non-Windows systems or on error.
+    """
+    if sys.platform != "win32":
+        return None
+
+    import winreg
+
+    names: set[str] = set()
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DEVICEMAP\SERIALCOMM") as key:
+            i = 0
+            while True:
+                try:
+                    _, value, _ = winreg.EnumValue(key, i)
+                except OSError:
+                    break
+                names.add(str(value))
+                i += 1
+    except OSError:
+        return None
+    return frozenset(names)
+
+
+def _list_ports() -> list:
+    """
+    Returns list_ports.comports(), reusing the previous result while it is
+    fresh (_PROBE_TTL) or, on Windows, while the registry reports the same
+    set of port names and the result is younger than _PORTS_MAX_AGE.
+
+    Concurrent callers wait for a single comports() walk.
+    """
+    global _ports_cache
+
+    names = _registry_port_names()
+    with _ports_cache_lock:
+        cached = _ports_cache
+        if cached is not None:
+            built_at, cached_names, ports = cached
+            age = time.monotonic() - built_at
+            if names is not None and names == cached_names and age < _PORTS_MAX_AGE:
+                return ports
+            if names is None and age < _PROBE_TTL:
+                return ports
+
+        ports = list(list_ports.comports())
+        _ports_cache = (time.monotonic(), names, ports)
+        return ports
+
 
 def _is_port_free(name: str) -> bool:
     """
     Attempts to open the port with minimal settings.
     - If successful: port is considered free.
     - If fails (SerialException or OS error): port is considered occupied.
+
+    On POSIX a plain non-blocking open() of the device node plus an isatty()
+    check is enough and skips pyserial's tty setup; like pyserial's open, a
+    path that is not a terminal device is not reported as free. On Windows
+    pyserial is used.
     """
+    if os.name == "posix":
+        try:
+            fd = os.open(name, os.O_RDWR | os.O_NONBLOCK | os.O_NOCTTY)
+        except OSError:
+            return False
+        try:
+            return os.isatty(fd)
+        finally:
+            os.close(fd)
+
     try:
         ser = serial.Serial(
             port=name,
@@ -38,16 +173,17 @@ def _is_port_free(name: str) -> bool:
         return False
 
 
-@router.get("/available", response_model=list[SerialPortInfo])
-def available_ports():
+def _list_free_ports() -> list[SerialPortInfo]:
     """
-    Returns a list of *free* COM ports.
-
-    Ports that cannot be opened (occupied or error) are filtered out.
+    Enumerates ports and probes them in parallel (blocking).
     """
+    ports = _list_ports()
+    with ThreadPoolExecutor(max_workers=min(32, len(ports) or 1)) as ex:
+        free = list(ex.map(_probe_port_cached, [p.device for p in ports]))
+
     result: list[SerialPortInfo] = []
-    for p in list_ports.comports():
-        if not _is_port_free(p.device):
+    for p, is_free in zip(ports, free):
+        if not is_free:
             continue
         result.append(
             SerialPortInfo(
@@ -59,12 +195,9 @@ def available_ports():
     return result
 
 
-@router.post("/test", response_model=SerialPortTestResponse)
-def test_port(req: SerialPortTestRequest):
+def _try_open_port(req: SerialPortTestRequest) -> SerialPortTestResponse:
     """
-    Attempts to open a specific port with the given settings.
-
-    Returns success=True if the port can be opened, otherwise returns the error.
+    Opens and closes the port with the requested settings (blocking).
     """
     try:
         ser = serial.Serial(
@@ -79,3 +212,25 @@ def test_port(req: SerialPortTestRequest):
         return SerialPortTestResponse(success=True)
     except Exception as exc:
         return SerialPortTestResponse(success=False, error=str(exc))
+
+
+@router.get("/available", response_model=list[SerialPortInfo])
+async def available_ports():
+    """
+    Returns a list of *free* COM ports.
+
+    Ports that cannot be opened (occupied or error) are filtered out.
+    Ports are probed in parallel, so the total latency is roughly one probe;
+    probe results are cached for a couple of seconds.
+    """
+    return await anyio.to_thread.run_sync(_list_free_ports)
+
+
+@router.post("/test", response_model=SerialPortTestResponse)
+async def test_port(req: SerialPortTestRequest):
+    """
+    Attempts to open a specific port with the given settings.
+
+    Returns success=True if the port can be opened, otherwise returns the error.
+    """
+    return await anyio.to_thread.run_sync(_try_open_port, req)
@@ -8,24 +8,37 @@ Responsibilities:
 - Test database connection with a simple query
 """
 
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import quote
 
-from sqlalchemy import create_engine, text
+import psycopg
+from psycopg.conninfo import make_conninfo
+from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import SQLAlchemyError
 
 from backend.app.schemas.db_settings import DbSettings, DbConnectionTestResult
 
 
+# Seconds to wait for the server in test_connection()
+TEST_CONNECT_TIMEOUT = 5
+
+
+@lru_cache(maxsize=64)
 def build_postgres_dsn(settings: DbSettings) -> str:
     """
     Constructs a PostgreSQL DSN (Data Source Name) based on the provided settings.
 
-    Note: In a production project, you should carefully escape user/password.
+    User, password and database name are percent-encoded, so characters
+    like '@', ':' or '/' in them do not break the URL. DbSettings is frozen,
+    so the result is cached per settings value.
     """
+    user = quote(settings.user, safe="")
+    password = quote(settings.password, safe="")
+    database = quote(settings.database, safe="")
     return (
-        f"postgresql+psycopg://{settings.user}:{settings.password}"
-        f"@{settings.host}:{settings.port}/{settings.database}"
+        f"postgresql+psycopg://{user}:{password}"
+        f"@{settings.host}:{settings.port}/{database}"
         f"?sslmode={settings.sslmode}"
     )
 
@@ -33,26 +46,46 @@ def build_postgres_dsn(settings: DbSettings) -> str:
 def create_engine_from_settings(settings: DbSettings) -> Engine:
     """
     Creates a SQLAlchemy Engine from the given DbSettings.
+
+    The pool is LIFO so the most recently used (warm) connection is reused
+    first and idle extras can time out.
     """
     dsn = build_postgres_dsn(settings)
-    return create_engine(dsn, pool_pre_ping=True)
+    return create_engine(
+        dsn,
+        pool_pre_ping=True,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_recycle=settings.pool_recycle,
+        pool_use_lifo=True,
+    )
 
 
 def test_connection(settings: DbSettings) -> DbConnectionTestResult:
     """
     Attempts to connect to the database and execute SELECT 1.
 
+    Uses a single psycopg connection instead of building (and disposing)
+    a SQLAlchemy Engine with its pool just for one query.
+
     Returns DbConnectionTestResult with success=True if connection succeeds,
     or success=False with an error message on failure.
     """
-    dsn = build_postgres_dsn(settings)
-    engine = create_engine(dsn, pool_pre_ping=True)
+    conninfo = make_conninfo(
+        host=settings.host,
+        port=settings.port,
+        dbname=settings.database,
+        user=settings.user,
+        password=settings.password,
+        sslmode=settings.sslmode,
+        connect_timeout=TEST_CONNECT_TIMEOUT,
+    )
 
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        with psycopg.connect(conninfo) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                cur.fetchone()
         return DbConnectionTestResult(success=True)
-    except SQLAlchemyError as exc:
+    except psycopg.Error as exc:
         return DbConnectionTestResult(success=False, error=str(exc))
-    finally:
-        engine.dispose()
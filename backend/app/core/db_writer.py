@@ -6,19 +6,106 @@ Provides interfaces and implementations to write data to PostgreSQL using SQLAlc
 
 Classes:
 - BaseDBWriter: abstract interface for DB writing.
-- SQLAlchemyDBWriter: concrete implementation using SQLAlchemy + psycopg.
+- SQLAlchemyDBWriter: concrete implementation using SQLAlchemy + psycopg,
+  with batched write_many() (executemany). The internal _copy_many()
+  (COPY FROM STDIN) and _pipeline() (several statements in one round trip)
+  have no callers yet and are not covered by tests.
 """
 
-from typing import Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from psycopg import sql as pg_sql
 from sqlalchemy import text
-from sqlalchemy.engine import Engine
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.exc import DBAPIError, OperationalError, SQLAlchemyError
 
-from backend.app.core.db_client import create_engine_from_settings
+from backend.app.core.db_client import build_postgres_dsn, create_engine_from_settings
 from backend.app.schemas.db_settings import DbSettings
 
 
+_EngineKey = Tuple[str, int, int, int]
+
+# Engines shared by all writers, keyed by DSN and pool options, with the
+# number of writers holding each one
+_engines: Dict[_EngineKey, Engine] = {}
+_engine_refs: Dict[_EngineKey, int] = {}
+_engines_lock = threading.Lock()
+
+
+def _engine_key(settings: DbSettings) -> _EngineKey:
+    return (
+        build_postgres_dsn(settings),
+        settings.pool_size,
+        settings.max_overflow,
+        settings.pool_recycle,
+    )
+
+
+def acquire_shared_engine(settings: DbSettings) -> Engine:
+    """
+    Returns the process-wide Engine for these settings, creating it once.
+
+    Loggers writing to the same database as the same user share one
+    connection pool instead of opening one pool each. Every call takes a
+    reference that must be given back with release_shared_engine(); the
+    engine is disposed when the last reference is released.
+    """
+    key = _engine_key(settings)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = create_engine_from_settings(settings)
+        _engine_refs[key] = _engine_refs.get(key, 0) + 1
+        return engine
+
+
+def release_shared_engine(settings: DbSettings, engine: Engine) -> None:
+    """
+    Releases a reference to `engine` taken by acquire_shared_engine().
+
+    The last release disposes the engine and closes its pooled connections.
+    Releasing an engine already dropped by dispose_all_engines() is a no-op,
+    even if a new engine has been created for the same settings since.
+    """
+    key = _engine_key(settings)
+    with _engines_lock:
+        if _engines.get(key) is not engine:
+            return
+        refs = _engine_refs[key]
+        if refs > 1:
+            _engine_refs[key] = refs - 1
+            return
+        del _engine_refs[key]
+        engine = _engines.pop(key)
+    engine.dispose()
+
+
+def dispose_all_engines() -> None:
+    """
+    Disposes every shared engine, regardless of references (shutdown).
+    """
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _engine_refs.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """
+    True if a write failed because the database connection is unusable
+    (server down, connection dropped), not because of the statement or its
+    parameters, so retrying the same rows right away will fail as well.
+    """
+    if isinstance(exc, OperationalError):
+        return True
+    return isinstance(exc, DBAPIError) and exc.connection_invalidated
+
+
 class BaseDBWriter:
     """
     Base interface for writing data to a database.
@@ -27,6 +114,14 @@ class BaseDBWriter:
     def write(self, sql: str, params: Dict[str, Any]) -> None:
         raise NotImplementedError
 
+    def write_many(self, sql: str, params_list: List[Dict[str, Any]]) -> None:
+        """
+        Executes the same SQL for several parameter sets.
+        The default implementation calls write() for each of them.
+        """
+        for params in params_list:
+            self.write(sql, params)
+
     def close(self) -> None:
         """
         Optional: release resources.
@@ -41,7 +136,11 @@ class SQLAlchemyDBWriter(BaseDBWriter):
 
     - Accepts "base" DbSettings (host, port, database, sslmode)
       and a specific user/password for the logger.
-    - Creates a SQLAlchemy Engine and reuses it between write() calls.
+    - Uses a shared SQLAlchemy Engine (one per DSN) between write() calls,
+      taken on first use and given back by close(). A closed writer takes
+      it again on its next write, so a worker can be stopped and restarted
+      with the same writer.
+    - Caches the text() clause per SQL string, since loggers reuse one query.
     """
 
     def __init__(
@@ -58,26 +157,116 @@ class SQLAlchemyDBWriter(BaseDBWriter):
             user=db_user,
             password=db_password,
             sslmode=base_settings.sslmode,
+            pool_size=base_settings.pool_size,
+            max_overflow=base_settings.max_overflow,
+            pool_recycle=base_settings.pool_recycle,
         )
-        self._engine: Engine = create_engine_from_settings(merged)
+        self._engine_settings = merged
+        self._engine: Optional[Engine] = None
+        self._engine_lock = threading.Lock()
+        self._text_cache: Dict[str, TextClause] = {}
 
     @property
     def engine(self) -> Engine:
-        return self._engine
+        """
+        The shared engine, acquired on first use after creation or close().
+        """
+        engine = self._engine
+        if engine is None:
+            with self._engine_lock:
+                engine = self._engine
+                if engine is None:
+                    engine = self._engine = acquire_shared_engine(self._engine_settings)
+        return engine
+
+    def prepare(self, sql: str) -> TextClause:
+        """
+        Returns the cached text() clause for the SQL string.
+        """
+        stmt = self._text_cache.get(sql)
+        if stmt is None:
+            stmt = self._text_cache.setdefault(sql, text(sql))
+        return stmt
 
     def write(self, sql: str, params: Dict[str, Any]) -> None:
         """
         Executes SQL with parameters in a separate transaction.
         """
+        self.write_prepared(self.prepare(sql), params)
+
+    def write_prepared(self, stmt: TextClause, params: Dict[str, Any]) -> None:
+        """
+        Same as write(), for a clause obtained from prepare().
+        """
         try:
-            with self._engine.begin() as conn:
-                conn.execute(text(sql), params)
+            with self.engine.begin() as conn:
+                conn.execute(stmt, params)
         except SQLAlchemyError:
             # Logging can be added here in the future
             raise
 
+    def write_many(self, sql: str, params_list: List[Dict[str, Any]]) -> None:
+        """
+        Executes SQL for all parameter sets in one transaction (executemany).
+        """
+        if not params_list:
+            return
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(self.prepare(sql), params_list)
+        except SQLAlchemyError:
+            raise
+
+    def _copy_many(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Bulk-inserts rows with COPY ... FROM STDIN in one transaction.
+
+        `table` may be schema-qualified ("schema.table"); names are quoted
+        as identifiers. Internal and untested: errors raised while copying
+        are psycopg errors, not SQLAlchemy ones.
+        """
+        stmt = pg_sql.SQL("COPY {} ({}) FROM STDIN").format(
+            pg_sql.Identifier(*table.split(".")),
+            pg_sql.SQL(", ").join(pg_sql.Identifier(c) for c in columns),
+        )
+        with self.engine.begin() as conn:
+            raw_conn = conn.connection.driver_connection
+            with raw_conn.cursor() as cur:
+                with cur.copy(stmt) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+
+    @contextmanager
+    def _pipeline(self) -> Iterator[Connection]:
+        """
+        Yields a connection in a transaction with psycopg pipeline mode on.
+
+        Statements executed on it are sent without waiting for each result
+        and synced once when the block exits, e.g. an INSERT followed by an
+        UPDATE costs one round trip instead of two:
+
+            with writer._pipeline() as conn:
+                conn.execute(writer.prepare(sql1), params1)
+                conn.execute(writer.prepare(sql2), params2)
+
+        Internal and untested: errors of the pipelined statements surface
+        when the pipeline syncs on exit, as raw psycopg errors rather than
+        SQLAlchemy ones, so `except SQLAlchemyError` does not catch them.
+        """
+        with self.engine.begin() as conn:
+            with conn.connection.driver_connection.pipeline():
+                yield conn
+
     def close(self) -> None:
         """
-        Dispose of the SQLAlchemy engine to release resources.
+        Drops this writer's cached statements and releases its reference to
+        the shared engine (disposed once no writer uses it). Safe to call
+        more than once; the writer stays usable and re-acquires the engine
+        on its next write.
         """
-        self._engine.dispose()
+        self._text_cache.clear()
+        with self._engine_lock:
+            engine = self._engine
+            self._engine = None
+        if engine is not None:
+            release_shared_engine(self._engine_settings, engine)
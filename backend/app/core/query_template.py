@@ -10,12 +10,15 @@ Classes:
 - QueryTemplateError: raised for invalid templates.
 
 Functions:
-- compile_query_template(template): compile {var} placeholders into :var for SQLAlchemy.
+- compile_query_template(template): compile {var} placeholders into :var for SQLAlchemy
+  (results are cached per template string).
 - build_query(template, variables): build SQL string and parameters dict from template and values.
 """
 
+import re
 from dataclasses import dataclass
-from typing import Dict, Any, Set, Tuple
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Set, Tuple
 
 
 @dataclass(frozen=True)
@@ -24,15 +27,49 @@ class CompiledQueryTemplate:
     Result of compiling a SQL query template:
     - sql: string with placeholders in :name format
     - param_names: set of parameter names extracted from the template
+
+    Instances are cached and shared, so they are fully immutable.
     """
     sql: str
-    param_names: Set[str]
+    param_names: FrozenSet[str]
 
 
 class QueryTemplateError(ValueError):
     """Errors during SQL query template parsing."""
 
 
+# Tokens, in priority order: escaped braces, {placeholder}, lone '}', plain text.
+# A placeholder runs up to the first '}', as before.
+_TOKEN_RE = re.compile(r"\{\{|\}\}|\{([^}]*)\}|\}|[^{}]+")
+
+# Raw placeholder text -> validated (stripped) name
+_VALID_NAMES: Dict[str, str] = {}
+_VALID_NAMES_MAX = 4096
+
+
+def _placeholder_name(raw: str) -> str:
+    """
+    Returns the stripped placeholder name, validating it on first sight.
+    """
+    name = _VALID_NAMES.get(raw)
+    if name is not None:
+        return name
+
+    name = raw.strip()
+    if not name:
+        raise QueryTemplateError("Empty placeholder '{}' in query template")
+    if not name.isidentifier():
+        raise QueryTemplateError(
+            f"Invalid placeholder name '{name}' in query template"
+        )
+
+    if len(_VALID_NAMES) >= _VALID_NAMES_MAX:
+        _VALID_NAMES.clear()
+    _VALID_NAMES[raw] = name
+    return name
+
+
+@lru_cache(maxsize=1024)
 def compile_query_template(template: str) -> CompiledQueryTemplate:
     """
     Compiles a template with {name} placeholders into SQL with :name parameters.
@@ -51,53 +88,35 @@ def compile_query_template(template: str) -> CompiledQueryTemplate:
     result_parts: list[str] = []
     param_names: Set[str] = set()
 
-    i = 0
-    n = len(template)
-
-    while i < n:
-        ch = template[i]
-
-        if ch == "{":
-            # Escaped '{{'
-            if i + 1 < n and template[i + 1] == "{":
-                result_parts.append("{")
-                i += 2
-                continue
-
-            # Start of placeholder
-            j = i + 1
-            while j < n and template[j] != "}":
-                j += 1
-            if j >= n:
-                raise QueryTemplateError("Unmatched '{' in query template")
-
-            name = template[i + 1 : j].strip()
-            if not name:
-                raise QueryTemplateError("Empty placeholder '{}' in query template")
-            if not name.isidentifier():
-                raise QueryTemplateError(
-                    f"Invalid placeholder name '{name}' in query template"
-                )
+    pos = 0
+    for m in _TOKEN_RE.finditer(template):
+        if m.start() != pos:
+            # Only a '{' without a closing '}' is left unmatched by _TOKEN_RE
+            raise QueryTemplateError("Unmatched '{' in query template")
+        pos = m.end()
+
+        token = m.group()
+        raw_name = m.group(1)
 
+        if raw_name is not None:
+            # Placeholder {name}
+            name = _placeholder_name(raw_name)
             param_names.add(name)
             result_parts.append(f":{name}")
-            i = j + 1
-            continue
-
-        if ch == "}":
-            # Escaped '}}'
-            if i + 1 < n and template[i + 1] == "}":
-                result_parts.append("}")
-                i += 2
-                continue
-            # Lone '}'
+        elif token == "{{":
+            result_parts.append("{")
+        elif token == "}}":
+            result_parts.append("}")
+        elif token == "}":
             raise QueryTemplateError("Single '}' in query template")
+        else:
+            # Plain text
+            result_parts.append(token)
 
-        # Normal character
-        result_parts.append(ch)
-        i += 1
+    if pos != len(template):
+        raise QueryTemplateError("Unmatched '{' in query template")
 
-    return CompiledQueryTemplate(sql="".join(result_parts), param_names=param_names)
+    return CompiledQueryTemplate(sql="".join(result_parts), param_names=frozenset(param_names))
 
 
 def build_query(
@@ -6,13 +6,21 @@ Provides:
 - Loading and saving global app settings to JSON
 - Access and update for database settings
 - Access and management of logger/connection configurations
-- Ensures uniqueness of connection names and assigns IDs
+- Ensures uniqueness of connection names and assigns IDs from a
+  monotonic counter stored in the settings file
+
+The parsed settings are cached in memory and re-read only when the file on
+disk changes (mtime/size). Lookups by connection id/name go through
+position indices kept next to the cache. Connections are handed out and
+stored as copies, so callers cannot modify the cache by accident.
 """
 
-import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from pydantic import ValidationError
+from pydantic_core import to_json
 
 from backend.app.schemas.db_settings import DbSettings
 from backend.app.schemas.app_settings import AppSettings
@@ -24,9 +32,57 @@ class ConnectionNameAlreadyExistsError(ValueError):
     pass
 
 
+# (id -> position, name -> position) over AppSettings.connections
+_ConnectionIndex = Tuple[Dict[int, int], Dict[str, int]]
+
+
+def _build_connection_index(connections: List[LoggerConnectionConfig]) -> _ConnectionIndex:
+    by_id: Dict[int, int] = {}
+    by_name: Dict[str, int] = {}
+    for idx, c in enumerate(connections):
+        if c.id is not None:
+            by_id[c.id] = idx
+        by_name[c.name] = idx
+    return by_id, by_name
+
+
 class SettingsManager:
     def __init__(self, settings_path: str) -> None:
         self._path = Path(settings_path)
+        self._lock = threading.RLock()
+
+        # Cached settings and the file stamp they were read from
+        self._cache: Optional[AppSettings] = None
+        self._cache_stamp: Optional[Tuple[int, int]] = None
+        # Index over the cached settings' connections, built on first use;
+        # dropped whenever the cached object or its connections list changes
+        self._index: Optional[_ConnectionIndex] = None
+
+        # Nesting depth of batch_updates() and whether a save was deferred
+        self._batch_depth = 0
+        self._batch_dirty = False
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _set_cache(self, settings: Optional[AppSettings], stamp: Optional[Tuple[int, int]]) -> None:
+        if settings is not self._cache:
+            self._index = None
+        self._cache = settings
+        self._cache_stamp = stamp
+
+    def _connection_index(self, app_settings: AppSettings) -> _ConnectionIndex:
+        """
+        Returns the index over the cached settings (app_settings must be
+        the object returned by load_app_settings()).
+        """
+        if self._index is None:
+            self._index = _build_connection_index(app_settings.connections)
+        return self._index
 
     def _ensure_parent_dir(self) -> None:
         if not self._path.parent.exists():
@@ -36,27 +92,78 @@ class SettingsManager:
         """
         Loads all application settings from JSON.
         If file does not exist or is empty — returns default settings.
+
+        The file is parsed again only if it changed since the last load/save.
+        The returned object is the cache itself: modify it only under the
+        manager's lock and save it right after.
         """
-        if not self._path.exists():
+        with self._lock:
+            if self._batch_depth and self._cache is not None:
+                # Deferred changes live only in memory until the batch ends
+                return self._cache
+
+            stamp = self._file_stamp()
+            if self._cache is not None and stamp == self._cache_stamp:
+                return self._cache
+
+            settings = self._read_app_settings(stamp)
+            self._set_cache(settings, stamp)
+            return settings
+
+    def _read_app_settings(self, stamp: Optional[Tuple[int, int]]) -> AppSettings:
+        if stamp is None:
             return AppSettings()
 
-        raw = self._path.read_text(encoding="utf-8")
+        raw = self._path.read_bytes()
         if not raw.strip():
             return AppSettings()
 
         try:
-            data = json.loads(raw)
-            return AppSettings(**data)
-        except (json.JSONDecodeError, ValidationError) as exc:
+            # Parse and validate in one pass with pydantic-core's JSON parser
+            return AppSettings.model_validate_json(raw)
+        except ValidationError as exc:
             raise RuntimeError(f"Invalid settings file format: {exc}") from exc
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Defers writes to the settings file until the outermost batch exits,
+        so a series of updates rewrites the file at most once.
+
+        The batch holds the manager lock, so only the calling thread's
+        writes are deferred; other threads wait until the batch ends.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._batch_dirty:
+                    self._batch_dirty = False
+                    if self._cache is not None:
+                        self.save_app_settings(self._cache)
+
     def save_app_settings(self, settings: AppSettings) -> None:
         """
         Saves all application settings to JSON.
+        Inside batch_updates() only the in-memory copy is updated.
         """
-        self._ensure_parent_dir()
-        json_text = settings.model_dump_json(indent=2, ensure_ascii=False)
-        self._path.write_text(json_text, encoding="utf-8")
+        with self._lock:
+            if self._batch_depth:
+                self._set_cache(settings, self._cache_stamp)
+                self._batch_dirty = True
+                return
+
+            try:
+                self._ensure_parent_dir()
+                # UTF-8 JSON bytes straight from pydantic-core, no str round trip
+                self._path.write_bytes(to_json(settings, indent=2))
+            except Exception:
+                # The cached object may already be modified by the caller
+                self._set_cache(None, None)
+                raise
+            self._set_cache(settings, self._file_stamp())
 
     # --- Database settings methods ---
 
@@ -72,93 +179,141 @@ class SettingsManager:
         """
         Updates only the DB section in JSON.
         """
-        app_settings = self.load_app_settings()
-        app_settings.db = db_settings
-        self.save_app_settings(app_settings)
-        return db_settings
+        with self._lock:
+            app_settings = self.load_app_settings()
+            app_settings.db = db_settings
+            self.save_app_settings(app_settings)
+            return db_settings
 
     # --- Logger/connection management methods ---
 
     def get_connections(self) -> List[LoggerConnectionConfig]:
         """
-        Returns the current list of loggers/connections.
+        Returns copies of the current loggers/connections.
         """
-        app_settings = self.load_app_settings()
-        return app_settings.connections
+        with self._lock:
+            app_settings = self.load_app_settings()
+            return [c.model_copy(deep=True) for c in app_settings.connections]
 
     def get_connection(self, conn_id: int) -> Optional[LoggerConnectionConfig]:
         """
-        Returns a logger/connection by ID.
+        Returns a copy of the logger/connection with this ID, or None.
         """
-        app_settings = self.load_app_settings()
-        for conn in app_settings.connections:
-            if conn.id == conn_id:
-                return conn
-        return None
+        with self._lock:
+            app_settings = self.load_app_settings()
+            by_id, _ = self._connection_index(app_settings)
+            idx = by_id.get(conn_id)
+            return app_settings.connections[idx].model_copy(deep=True) if idx is not None else None
 
-    def _assign_new_connection_id(self, connections: List[LoggerConnectionConfig]) -> int:
+    @staticmethod
+    def _apply_upsert(
+        app_settings: AppSettings,
+        index: _ConnectionIndex,
+        connection: LoggerConnectionConfig,
+    ) -> None:
         """
-        Generates a new ID for a logger/connection.
+        Inserts or replaces `connection` in app_settings.connections (in place)
+        and updates `index` accordingly.
+        Raises ConnectionNameAlreadyExistsError on a duplicate name.
         """
-        if not connections:
-            return 1
-        max_id = max((c.id or 0) for c in connections)
-        return max_id + 1
+        connections = app_settings.connections
+        by_id, by_name = index
+
+        # --- check name uniqueness ---
+        # if names match and it's NOT the same object (by id) — forbid
+        idx = by_name.get(connection.name)
+        if idx is not None and connections[idx].id != connection.id:
+            raise ConnectionNameAlreadyExistsError(
+                f"Connection with name '{connection.name}' already exists (id={connections[idx].id})"
+            )
+
+        if connection.id is None:
+            connection.id = app_settings.allocate_connection_id()
+            idx = None
+        else:
+            idx = by_id.get(connection.id)
+
+        if idx is None:
+            idx = len(connections)
+            connections.append(connection)
+            if connection.id >= app_settings.next_connection_id:
+                app_settings.next_connection_id = connection.id + 1
+        else:
+            old_name = connections[idx].name
+            if by_name.get(old_name) == idx:
+                del by_name[old_name]
+            connections[idx] = connection
+
+        by_id[connection.id] = idx
+        by_name[connection.name] = idx
 
     def upsert_connection(self, connection: LoggerConnectionConfig) -> LoggerConnectionConfig:
         """
         Creates or updates a logger/connection.
         If id is None — assigns a new ID.
         Checks uniqueness of the 'name' field before saving.
+        The given object is not modified; the saved copy is returned.
         """
-        app_settings = self.load_app_settings()
-        connections = app_settings.connections
+        with self._lock:
+            app_settings = self.load_app_settings()
+            stored = connection.model_copy(deep=True)
+            self._apply_upsert(app_settings, self._connection_index(app_settings), stored)
+            self.save_app_settings(app_settings)
+            return stored.model_copy(deep=True)
 
-        # --- check name uniqueness ---
-        for existing in connections:
-            # if names match and it's NOT the same object (by id) — forbid
-            if existing.name == connection.name and existing.id != connection.id:
-                raise ConnectionNameAlreadyExistsError(
-                    f"Connection with name '{connection.name}' already exists (id={existing.id})"
-                )
+    def bulk_upsert_connections(
+        self,
+        connections: List[LoggerConnectionConfig],
+    ) -> List[LoggerConnectionConfig]:
+        """
+        Creates or updates several loggers/connections and writes the file once.
+        Either all changes are saved or, on a duplicate name, none of them.
 
-        if connection.id is None:
-            new_id = self._assign_new_connection_id(connections)
-            connection.id = new_id
-            connections.append(connection)
-        else:
-            for idx, existing in enumerate(connections):
-                if existing.id == connection.id:
-                    connections[idx] = connection
-                    break
-            else:
-                connections.append(connection)
+        The given objects are not modified: copies are stored (with new IDs
+        assigned) and returned.
+        """
+        with self._lock:
+            # Work on copies so a failure leaves the cache and inputs untouched
+            draft = self.load_app_settings().model_copy()
+            draft.connections = list(draft.connections)
+            index = _build_connection_index(draft.connections)
 
-        app_settings.connections = connections
-        self.save_app_settings(app_settings)
-        return connection
+            stored = [c.model_copy(deep=True) for c in connections]
+            for connection in stored:
+                self._apply_upsert(draft, index, connection)
+
+            self.save_app_settings(draft)
+            self._index = index
+            return [c.model_copy(deep=True) for c in stored]
 
     def delete_connection(self, conn_id: int) -> bool:
         """
         Deletes a logger/connection by ID.
         """
-        app_settings = self.load_app_settings()
-        connections = app_settings.connections
+        with self._lock:
+            app_settings = self.load_app_settings()
+            connections = app_settings.connections
 
-        new_connections = [c for c in connections if c.id != conn_id]
-        deleted = len(new_connections) != len(connections)
+            new_connections = [c for c in connections if c.id != conn_id]
+            deleted = len(new_connections) != len(connections)
 
-        if deleted:
-            app_settings.connections = new_connections
-            self.save_app_settings(app_settings)
+            if deleted:
+                app_settings.connections = new_connections
+                self._index = None
+                self.save_app_settings(app_settings)
 
-        return deleted
+            return deleted
 
     def save_connections(self, connections: List[LoggerConnectionConfig]) -> List[LoggerConnectionConfig]:
         """
         Saves logger/connection settings to JSON.
         """
-        app_settings = self.load_app_settings()
-        app_settings.connections = connections
-        self.save_app_settings(app_settings)
-        return connections
+        with self._lock:
+            app_settings = self.load_app_settings()
+            app_settings.connections = [c.model_copy(deep=True) for c in connections]
+            self._index = None
+            max_id = max((c.id or 0 for c in connections), default=0)
+            if app_settings.next_connection_id <= max_id:
+                app_settings.next_connection_id = max_id + 1
+            self.save_app_settings(app_settings)
+            return connections
@@ -22,12 +22,105 @@ Provides:
 import threading
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from collections import deque
-from datetime import datetime
+from itertools import islice
 import time
 
 
+TIMESTAMP_FORMAT = "%d-%m-%Y %H:%M:%S"
+
+# format -> (epoch second, formatted string); entries are replaced as a
+# whole, so reads need no lock
+_ts_cache: Dict[str, Tuple[int, str]] = {}
+
+
+def format_ts(sec: int, fmt: str = TIMESTAMP_FORMAT) -> str:
+    """
+    Formats an epoch second as local time (TIMESTAMP_FORMAT by default).
+
+    The last formatted second is remembered per format, so repeated calls
+    within the same second reuse the string.
+    """
+    cached = _ts_cache.get(fmt)
+    if cached is not None and cached[0] == sec:
+        return cached[1]
+    text = time.strftime(fmt, time.localtime(sec))
+    _ts_cache[fmt] = (sec, text)
+    return text
+
+
+def now_str(fmt: str = TIMESTAMP_FORMAT) -> str:
+    """
+    Returns the current local time formatted with fmt (TIMESTAMP_FORMAT by default).
+    """
+    return format_ts(int(time.time()), fmt)
+
+
+# Buffer entry: (epoch second, message); formatted only when read
+LogEntry = Tuple[int, str]
+
+
+def _format_entry(entry: LogEntry) -> str:
+    return f"{format_ts(entry[0])} — {entry[1]}"
+
+
+def _format_entries(entries) -> List[str]:
+    """
+    Formats buffer entries as "<timestamp> — <message>".
+    Neighbouring entries usually share a second, so each second is
+    formatted once.
+    """
+    stamps: Dict[int, str] = {}
+    out: List[str] = []
+    for sec, msg in entries:
+        ts = stamps.get(sec)
+        if ts is None:
+            ts = stamps[sec] = format_ts(sec)
+        out.append(f"{ts} — {msg}")
+    return out
+
+
+def _deque_tail(buf: deque, limit: int) -> List[LogEntry]:
+    """
+    Returns the last `limit` items of the deque (all items if limit <= 0)
+    without copying the rest of it.
+    """
+    size = len(buf)
+    if limit <= 0 or limit >= size:
+        return list(buf)
+    return list(islice(buf, size - limit, size))
+
+
+# EMA metrics are kept as integer microseconds; alpha is scaled by this
+_EMA_SCALE = 1000
+
+
+class _Timed:
+    """
+    Context manager returned by BaseConnectionWorker._timed().
+
+    A plain class rather than @contextmanager: entering and leaving it
+    costs two method calls and no generator or closure allocation.
+    """
+
+    __slots__ = ("_worker", "_last_key", "_avg_key", "_alpha", "_extra", "_t0")
+
+    def __init__(self, worker: "BaseConnectionWorker", last_key: str, avg_key: str, alpha: float, extra: bool) -> None:
+        self._worker = worker
+        self._last_key = last_key
+        self._avg_key = avg_key
+        self._alpha = alpha
+        self._extra = extra
+
+    def __enter__(self) -> None:
+        self._t0 = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        dt_ms = (time.perf_counter() - self._t0) * 1000.0
+        self._worker._metric_ema_update(self._last_key, self._avg_key, dt_ms, alpha=self._alpha, extra=self._extra)
+
+
 class WorkerState(str, Enum):
     CREATED = "created"
     RUNNING = "running"
@@ -41,15 +134,17 @@ class BaseConnectionWorker(ABC):
     Base interface for a logger/connection worker.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_messages: int = 200, max_errors: int = 50) -> None:
         self._state: WorkerState = WorkerState.CREATED
         self._state_lock = threading.Lock()
-        self._last_error: Optional[str] = None
+        self._last_error: Optional[LogEntry] = None
 
-        # Buffers for recent messages/errors
+        # Buffers for recent messages/errors, stored as (second, text)
+        # and formatted on read
         self._log_lock = threading.Lock()
-        self._message_buffer = deque(maxlen=200)  # last N messages
-        self._error_buffer = deque(maxlen=50)  # last N errors
+        self._message_buffer: deque = deque(maxlen=max_messages)  # last N messages
+        self._error_buffer: deque = deque(maxlen=max_errors)  # last N errors
+        self._last_message_sec: Optional[int] = None
 
         # Metrics
         self._metrics_lock = threading.Lock()
@@ -73,7 +168,8 @@ class BaseConnectionWorker(ABC):
             "db_write_latency_ms_avg": None,
         }
         self._extra_metrics = {}
-
+        # (extra, key) -> value in integer microseconds, see _metric_ema_update
+        self._ema_us: Dict[Tuple[bool, str], int] = {}
 
     @property
     def state(self) -> WorkerState:
@@ -82,7 +178,8 @@ class BaseConnectionWorker(ABC):
 
     @property
     def last_error(self) -> Optional[str]:
-        return self._last_error
+        entry = self._last_error
+        return _format_entry(entry) if entry is not None else None
 
     @property
     def recent_messages(self) -> List[str]:
@@ -90,7 +187,8 @@ class BaseConnectionWorker(ABC):
         Returns a copy of the buffer with recent messages (with timestamps).
         """
         with self._log_lock:
-            return list(self._message_buffer)
+            entries = list(self._message_buffer)
+        return _format_entries(entries)
 
     @property
     def recent_errors(self) -> List[str]:
@@ -98,7 +196,18 @@ class BaseConnectionWorker(ABC):
         Returns a copy of the buffer with recent errors (with timestamps).
         """
         with self._log_lock:
-            return list(self._error_buffer)
+            entries = list(self._error_buffer)
+        return _format_entries(entries)
+
+    def snapshot_logs(self, messages_limit: int, errors_limit: int) -> Tuple[List[str], List[str]]:
+        """
+        Returns (messages, errors) tails taken under a single lock,
+        so both lists describe the same moment. Limits <= 0 mean "all".
+        """
+        with self._log_lock:
+            messages = _deque_tail(self._message_buffer, messages_limit)
+            errors = _deque_tail(self._error_buffer, errors_limit)
+        return _format_entries(messages), _format_entries(errors)
 
     def _set_state(self, state: WorkerState) -> None:
         with self._state_lock:
@@ -108,31 +217,29 @@ class BaseConnectionWorker(ABC):
         """
         Sets state to ERROR and records the error with timestamp.
         """
-        timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-        formatted = f"{timestamp} — {msg}"
+        entry = (int(time.time()), msg)
 
         with self._log_lock:
-            self._last_error = formatted
-            self._error_buffer.append(formatted)
+            self._last_error = entry
+            self._error_buffer.append(entry)
 
         with self._metrics_lock:
             self._metrics["errors_total"] += 1
             self._metrics["consecutive_errors"] += 1
-            self._metrics["last_error_at"] = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+            self._metrics["last_error_at"] = format_ts(entry[0])
 
     def _log_message(self, msg: str) -> None:
         """
         Local worker log: adds a message to the ring buffer.
-        Message is prepended with timestamp.
+        The timestamp is recorded as an epoch second and formatted on read.
         """
-        timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-        formatted = f"{timestamp} — {msg}"
+        sec = int(time.time())
         with self._log_lock:
-            self._message_buffer.append(formatted)
+            self._message_buffer.append((sec, msg))
 
+        self._last_message_sec = sec
         with self._metrics_lock:
             self._metrics["messages_total"] += 1
-            self._metrics["last_message_at"] = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
             self._metrics["consecutive_errors"] = 0
 
     @abstractmethod
@@ -183,9 +290,15 @@ class BaseConnectionWorker(ABC):
 
     def get_metrics(self) -> dict:
         with self._metrics_lock:
+            metrics = dict(self._metrics)
+            if self._last_message_sec is not None:
+                metrics["last_message_at"] = format_ts(self._last_message_sec)
+            extra_metrics = dict(self._extra_metrics)
+            for (extra, key), value_us in self._ema_us.items():
+                (extra_metrics if extra else metrics)[key] = value_us / 1000
             return {
-                "metrics": dict(self._metrics),
-                "extra": dict(self._extra_metrics),
+                "metrics": metrics,
+                "extra": extra_metrics,
             }
 
     def _metric_ema_update(
@@ -199,18 +312,37 @@ class BaseConnectionWorker(ABC):
         """
         Updates last and avg using EMA:
           avg = alpha * value + (1-alpha) * avg
+
+        `value` is in ms. Both values are stored as integer microseconds
+        and converted back to ms in get_metrics().
         """
+        value_us = int(value * 1000)
+        alpha_num = int(alpha * _EMA_SCALE)
+        avg_id = (extra, avg_key)
         with self._metrics_lock:
-            target = self._extra_metrics if extra else self._metrics
-            target[last_key] = round(float(value), 3)
-            prev = target.get(avg_key)
+            ema = self._ema_us
+            ema[(extra, last_key)] = value_us
+            prev = ema.get(avg_id)
             if prev is None:
-                target[avg_key] = round(float(value), 3)
-            else:
-                target[avg_key] = round(
-                    alpha * float(value) + (1.0 - alpha) * float(prev),
-                    3
-                )
+                ema[avg_id] = value_us
+            elif prev != value_us:
+                ema[avg_id] = (alpha_num * value_us + (_EMA_SCALE - alpha_num) * prev) // _EMA_SCALE
+
+    def _timed(
+        self,
+        last_key: str,
+        avg_key: str,
+        alpha: float = 0.2,
+        extra: bool = False,
+    ) -> _Timed:
+        """
+        Times the `with` block and updates execution time metrics (in ms),
+        also when the block raises:
+
+            with self._timed("db_write_latency_ms_last", "db_write_latency_ms_avg"):
+                writer.write(sql, params)
+        """
+        return _Timed(self, last_key, avg_key, alpha, extra)
 
     def _metric_time_block(
         self,
@@ -222,15 +354,15 @@ class BaseConnectionWorker(ABC):
     ):
         """
         Executes fn() and updates execution time metrics (in ms).
+        Prefer _timed() on hot paths, it needs no callable.
         """
-        t0 = time.perf_counter()
-        try:
+        with _Timed(self, last_key, avg_key, alpha, extra):
             return fn()
-        finally:
-            dt_ms = (time.perf_counter() - t0) * 1000.0
-            self._metric_ema_update(last_key, avg_key, dt_ms, alpha=alpha, extra=extra)
 
     def _init_extra_metrics(self, defaults: dict) -> None:
+        """
+        Declares extra metrics with their initial values.
+        """
         with self._metrics_lock:
             for k, v in defaults.items():
                 self._extra_metrics.setdefault(k, v)
\ No newline at end of file
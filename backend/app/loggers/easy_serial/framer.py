@@ -10,9 +10,43 @@ Includes:
 - EasySerialFramer: incremental framer for payload extraction
 """
 
+import codecs
+import re
 from typing import List, Optional
 
 
+# '\\' pairs are matched first so '\\u0041' is not taken for an escape
+_U_ESCAPE_RE = re.compile(r"\\\\|\\u([0-9a-fA-F]{4})")
+
+# Patterns where codecs.escape_decode() gives exactly the same bytes as the
+# manual loop below ('\0' followed by a digit would be read as octal there)
+_SAFE_ESCAPES_RE = re.compile(r"(?:[^\\]|\\[nrtbfva\\]|\\x[0-9a-fA-F]{2}|\\0(?![0-7]))*")
+
+
+def _u_escape_to_x(m: "re.Match[str]") -> str:
+    code = m.group(1)
+    if code is None:
+        return m.group()
+    # \uXXXX keeps only the least significant byte
+    return "\\x%02x" % (int(code, 16) & 0xFF)
+
+
+def _decode_escaped_fast(pattern: str) -> Optional[bytes]:
+    """
+    Decodes common escapes with the C escape decoder.
+    Returns None if the pattern needs the manual loop.
+    """
+    if "\\u" in pattern:
+        pattern = _U_ESCAPE_RE.sub(_u_escape_to_x, pattern)
+    if _SAFE_ESCAPES_RE.fullmatch(pattern) is None:
+        return None
+    try:
+        raw = pattern.encode("latin-1")
+    except UnicodeEncodeError:
+        return None
+    return codecs.escape_decode(raw)[0]
+
+
 def decode_escaped_bytes(pattern: Optional[str]) -> Optional[bytes]:
     """
     Easy Serial message framer.
@@ -27,6 +61,10 @@ def decode_escaped_bytes(pattern: Optional[str]) -> Optional[bytes]:
     if pattern is None:
         return None
 
+    fast = _decode_escaped_fast(pattern)
+    if fast is not None:
+        return fast
+
     result = bytearray()
     i = 0
     n = len(pattern)
@@ -125,6 +163,10 @@ def decode_escaped_bytes(pattern: Optional[str]) -> Optional[bytes]:
     return bytes(result)
 
 
+# Consumed prefix size after which the buffer is compacted
+_COMPACT_THRESHOLD = 4096
+
+
 class EasySerialFramer:
     """
     Incremental framer for Easy Serial messages.
@@ -136,6 +178,9 @@ class EasySerialFramer:
         _preamble_bytes: bytes of preamble or None
         _terminator_bytes: bytes of terminator (mandatory)
         _buf: internal buffer of incoming bytes
+        _buf_start: offset of the first unconsumed byte in _buf
+        _scan_pos: buffer length already searched for the terminator of
+            the current frame, so new chunks do not rescan old bytes
     """
 
     def __init__(self, preamble: Optional[str], terminator: str) -> None:
@@ -144,7 +189,19 @@ class EasySerialFramer:
 
         self._preamble_bytes = decode_escaped_bytes(preamble)
         self._terminator_bytes = decode_escaped_bytes(terminator)
+        self._pre_len = len(self._preamble_bytes) if self._preamble_bytes is not None else 0
+        self._term_len = len(self._terminator_bytes)
         self._buf = bytearray()
+        self._buf_start = 0
+        self._scan_pos = 0
+
+    def reset(self) -> None:
+        """
+        Drops any buffered bytes so the framer can be reused for a new stream.
+        """
+        self._buf.clear()
+        self._buf_start = 0
+        self._scan_pos = 0
 
     def feed(self, data: bytes) -> List[bytes]:
         """
@@ -160,36 +217,69 @@ class EasySerialFramer:
         if not data:
             return frames
 
-        self._buf.extend(data)
-
-        while True:
-            start_index = 0
-
-            # search for preamble if defined
-            if self._preamble_bytes is not None:
-                idx = self._buf.find(self._preamble_bytes)
-                if idx == -1:
-                    # preamble not found yet; trim buffer to avoid memory growth
-                    max_keep = len(self._preamble_bytes) - 1
-                    if max_keep > 0 and len(self._buf) > max_keep:
-                        del self._buf[: len(self._buf) - max_keep]
-                    return frames
-
-                # discard everything before preamble
-                if idx > 0:
-                    del self._buf[:idx]
-                start_index = len(self._preamble_bytes)
-
-            # search for terminator
-            term_idx = self._buf.find(self._terminator_bytes, start_index)
-            if term_idx == -1:
-                # terminator not found yet
-                return frames
-                
-            # extract payload
-            payload = bytes(self._buf[start_index:term_idx])
-            frames.append(payload)
-
-            # remove processed bytes from buffer
-            del self._buf[: term_idx + len(self._terminator_bytes)]
-            # continue to check for more frames in buffer
+        buf = self._buf
+        buf.extend(data)
+
+        pre = self._preamble_bytes
+        pre_len = self._pre_len
+        term = self._terminator_bytes
+        term_len = self._term_len
+        scan_pos = self._scan_pos
+
+        # Consumed bytes are skipped via `pos` and compacted once per feed,
+        # instead of memmoving the buffer after every frame
+        pos = self._buf_start
+
+        # Payloads are copied once, straight from a view of the buffer
+        with memoryview(buf) as view:
+            while True:
+                start_index = pos
+
+                # search for preamble if defined
+                if pre is not None:
+                    idx = buf.find(pre, pos)
+                    if idx == -1:
+                        # preamble not found yet; keep only a possible partial preamble
+                        pos = max(pos, len(buf) - (pre_len - 1))
+                        scan_pos = 0
+                        break
+
+                    # discard everything before preamble
+                    if idx > pos:
+                        pos = idx
+                        scan_pos = 0
+                    start_index = pos + pre_len
+
+                # search for terminator, skipping bytes already scanned
+                # (minus an overlap in case the terminator was split)
+                search_from = max(start_index, scan_pos - term_len + 1)
+                term_idx = buf.find(term, search_from)
+                if term_idx == -1:
+                    # terminator not found yet
+                    scan_pos = len(buf)
+                    break
+
+                # extract payload
+                frames.append(bytes(view[start_index:term_idx]))
+
+                # mark processed bytes as consumed
+                pos = term_idx + term_len
+                scan_pos = 0
+                # continue to check for more frames in buffer
+
+        self._scan_pos = scan_pos
+        self._compact(pos)
+        return frames
+
+    def _compact(self, pos: int) -> None:
+        """
+        Stores the consume offset and drops the consumed prefix once it is
+        large (or most of the buffer).
+        """
+        buf = self._buf
+        if pos and (pos > _COMPACT_THRESHOLD or pos > len(buf) // 2):
+            del buf[:pos]
+            if self._scan_pos:
+                self._scan_pos -= pos
+            pos = 0
+        self._buf_start = pos
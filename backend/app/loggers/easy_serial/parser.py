@@ -5,13 +5,14 @@ Easy Serial payload parser.
 Converts a raw payload string into a dictionary of typed fields based on parser settings.
 
 Includes:
-- _find_field_cfg(): helper to get field configuration by index
-- _coerce_value(): convert raw string to the expected type
+- _compile_converter(): pick the converter for a field's type (_CONVERTERS)
+- _get_plan(): per-settings list of (name, index, converter) and split limit,
+  compiled once
 - parse_payload_text(): main function to parse a payload string
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from backend.app.loggers.easy_serial.config import (
     EasySerialParserSettings,
@@ -19,54 +20,122 @@ from backend.app.loggers.easy_serial.config import (
 )
 
 
-def _find_field_cfg(
-    fields: List[EasySerialParsedFieldConfig],
-    index: int,
-) -> Optional[EasySerialParsedFieldConfig]:
+# strptime formats that datetime.fromisoformat() parses identically for
+# zero-padded input of the given length, with separators at the given positions
+_ISO_FORMATS = {
+    "%Y-%m-%d": (10, ((4, "-"), (7, "-"))),
+    "%Y-%m-%dT%H:%M:%S": (19, ((4, "-"), (7, "-"), (10, "T"), (13, ":"), (16, ":"))),
+    "%Y-%m-%d %H:%M:%S": (19, ((4, "-"), (7, "-"), (10, " "), (13, ":"), (16, ":"))),
+}
+
+
+def _iso_converter(fmt: str) -> Optional[Callable[[str], datetime]]:
     """
-    Lookup field configuration by its index in the split payload.
+    Returns a fromisoformat()-based converter for ISO-8601 formats, or None.
 
-    Returns:
-        EasySerialParsedFieldConfig or None if not found
+    Input of any other shape, and anything fromisoformat() rejects, goes
+    through strptime(), so accepted values and error messages stay the same.
     """
-    for f in fields:
-        if f.index == index:
-            return f
-    return None
+    shape = _ISO_FORMATS.get(fmt)
+    if shape is None:
+        return None
+    length, seps = shape
+    fromiso = datetime.fromisoformat
+    strptime = datetime.strptime
 
+    def convert(raw: str) -> datetime:
+        if len(raw) == length and all(raw[i] == c for i, c in seps):
+            try:
+                return fromiso(raw)
+            except ValueError:
+                pass
+        return strptime(raw, fmt)
 
-def _coerce_value(raw: str, cfg: Optional[EasySerialParsedFieldConfig]) -> Any:
-    """
-    Convert raw string value to the type specified in field configuration.
+    return convert
 
-    Supported types: string, int, float, datetime/date/time (requires format)
 
-    Args:
-        raw: the raw string from payload
-        cfg: field configuration, may contain type and format
+# (variable name, index after split, converter of the raw field)
+_PlanEntry = Tuple[str, int, Callable[[str], Any]]
 
-    Returns:
-        value converted to proper type
+
+def _string_converter(cfg: EasySerialParsedFieldConfig) -> Callable[[str], Any]:
+    return str.strip
+
+
+def _int_converter(cfg: EasySerialParsedFieldConfig) -> Callable[[str], Any]:
+    return int
+
+
+def _float_converter(cfg: EasySerialParsedFieldConfig) -> Callable[[str], Any]:
+    return float
+
+
+def _datetime_converter(cfg: EasySerialParsedFieldConfig) -> Callable[[str], Any]:
+    fmt = cfg.format
+    if not fmt:
+        message = f"Field {cfg.index}: format is required for {(cfg.type or '').lower()}"
+
+        def missing_format(raw: str) -> Any:
+            raise ValueError(message)
+
+        return missing_format
+
+    convert = _iso_converter(fmt) or (lambda raw: datetime.strptime(raw, fmt))
+    return lambda raw: convert(raw.strip())
+
+
+# field type -> factory of the converter for that field
+_CONVERTERS: Dict[str, Callable[[EasySerialParsedFieldConfig], Callable[[str], Any]]] = {
+    "string": _string_converter,
+    "int": _int_converter,
+    "float": _float_converter,
+    "datetime": _datetime_converter,
+    "date": _datetime_converter,
+    "time": _datetime_converter,
+}
+
+
+def _compile_converter(cfg: EasySerialParsedFieldConfig) -> Callable[[str], Any]:
     """
-    
-    if cfg is None:
-        return raw
+    Returns the function converting a raw (unstripped) field to its type.
 
-    t = (cfg.type or "string").lower()
+    Supported types: string, int, float, datetime/date/time (requires format).
+    Strings (and unknown types) are only stripped. int() and float() ignore
+    surrounding whitespace themselves, so numeric fields skip the strip.
+    """
+    factory = _CONVERTERS.get((cfg.type or "string").lower(), _string_converter)
+    return factory(cfg)
 
-    if t == "string":
-        return raw
-    if t == "int":
-        return int(raw)
-    if t == "float":
-        return float(raw)
-    if t in ("datetime", "date", "time"):
-        if not cfg.format:
-            raise ValueError(f"Field {cfg.index}: format is required for {t}")
-        return datetime.strptime(raw, cfg.format)
 
-    # unknown type, return as-is
-    return raw
+# id(fields) -> (fields, plan, maxsplit, no negative indices); see _get_plan.
+# Kept outside the settings model so it does not take part in its __eq__.
+_PLAN_CACHE_SIZE = 64
+_plans: Dict[int, Tuple[List[EasySerialParsedFieldConfig], List[_PlanEntry], int, bool]] = {}
+
+
+def _get_plan(settings: EasySerialParserSettings) -> Tuple[List[_PlanEntry], int, bool]:
+    """
+    Returns (coercion plan, maxsplit, no negative indices) for the settings,
+    compiling them on first use. maxsplit stops str.split() right after the
+    highest field index in use, so unused trailing fields are not
+    materialized.
+
+    The plan depends only on the `fields` list, so it is cached by that
+    list's identity (replacing `fields` rebuilds it). The entry keeps the
+    list alive, so its id cannot be reused by another list meanwhile.
+    """
+    fields = settings.fields
+    cached = _plans.get(id(fields))
+    if cached is not None and cached[0] is fields:
+        return cached[1], cached[2], cached[3]
+
+    plan = [(f.name, f.index, _compile_converter(f)) for f in fields]
+    maxsplit = max((f.index + 1 for f in fields), default=0)
+    no_negative = all(f.index >= 0 for f in fields)
+    if len(_plans) >= _PLAN_CACHE_SIZE:
+        _plans.clear()
+    _plans[id(fields)] = (fields, plan, maxsplit, no_negative)
+    return plan, maxsplit, no_negative
 
 
 def parse_payload_text(
@@ -77,7 +146,7 @@ def parse_payload_text(
     Parse a single payload string according to parser settings.
 
     Steps:
-    1. Split the string by the configured separator
+    1. Split the string by the configured separator (up to the last used index)
     2. For each field configuration, take the value at the specified index
     3. Convert the value to the expected type (string/int/float/datetime)
 
@@ -92,19 +161,24 @@ def parse_payload_text(
         IndexError: if a field index is out of bounds
         ValueError: if conversion to the expected type fails
     """
-    parts = payload_text.split(settings.separator)
+    plan, maxsplit, no_negative = _get_plan(settings)
+    parts = payload_text.split(settings.separator, maxsplit)
+    n_parts = len(parts)
     result: Dict[str, Any] = {}
 
-    for field in settings.fields:
-        if field.index < 0 or field.index >= len(parts):
+    # Common case: every index is in range, so skip the per-field checks
+    if no_negative and n_parts >= maxsplit:
+        for name, index, convert in plan:
+            result[name] = convert(parts[index])
+        return result
+
+    for name, index, convert in plan:
+        if index < 0 or index >= n_parts:
             raise IndexError(
-                f"Variable '{field.name}' refers to index {field.index}, "
-                f"but only {len(parts)} fields present"
+                f"Variable '{name}' refers to index {index}, "
+                f"but only {n_parts} fields present"
             )
 
-        raw_value = parts[field.index].strip()
-        field_cfg = _find_field_cfg(settings.fields, field.index)
-        value = _coerce_value(raw_value, field_cfg)
-        result[field.name] = value
+        result[name] = convert(parts[index])
 
     return result
@@ -15,25 +15,111 @@ Easy Serial connection worker.
 - Handles optional auto-reconnect (autoconnect=True)
 - Reads raw bytes and frames them based on preamble/terminator
 - Parses payloads into a dict of variables
-- Uses query_template to build SQL and send to DBWriter
+- Uses query_template to build SQL and send to DBWriter, batching the rows
+  of a read burst into one executemany
 """
 
+import codecs
 import threading
 import time
-from typing import Optional, Dict, Any
-from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Any, List, Tuple
 
 import serial
 from serial import Serial, SerialException
 
-from backend.app.loggers.base import BaseConnectionWorker, WorkerState
+from backend.app.loggers.base import BaseConnectionWorker, WorkerState, now_str
 from backend.app.loggers.models import LoggerConnectionConfig
 from backend.app.loggers.easy_serial.config import EasySerialConfig
 from backend.app.loggers.easy_serial.framer import EasySerialFramer
 from backend.app.loggers.easy_serial.parser import parse_payload_text
 
 from backend.app.core.query_template import build_query
-from backend.app.core.db_writer import BaseDBWriter
+from backend.app.core.db_writer import BaseDBWriter, is_connection_error
+
+
+# map user-friendly settings to pyserial constants
+_DATABITS_MAP = {
+    5: serial.FIVEBITS,
+    6: serial.SIXBITS,
+    7: serial.SEVENBITS,
+    8: serial.EIGHTBITS,
+}
+_PARITY_MAP = {
+    "None": serial.PARITY_NONE,
+    "Even": serial.PARITY_EVEN,
+    "Odd": serial.PARITY_ODD,
+    "Mark": serial.PARITY_MARK,
+    "Space": serial.PARITY_SPACE,
+}
+_STOPBITS_MAP = {
+    1.0: serial.STOPBITS_ONE,
+    1.5: serial.STOPBITS_ONE_POINT_FIVE,
+    2.0: serial.STOPBITS_TWO,
+}
+
+# Codecs that bytes.decode() handles without a codec registry lookup
+_BUILTIN_CODECS = frozenset({"utf-8", "ascii", "latin-1", "iso8859-1"})
+
+
+def _payload_decoder(encoding: str) -> Callable[[bytes], str]:
+    """
+    Returns a function decoding payloads with `encoding`.
+
+    Decoding is strict first and falls back to errors="replace" only for
+    invalid input, since the strict path is the cheaper one. Codecs other
+    than the built-in fast ones are looked up once instead of per payload.
+    """
+    try:
+        info = codecs.lookup(encoding)
+    except LookupError:
+        # keep reporting the bad encoding per payload, as a parse error
+        return lambda payload: payload.decode(encoding, errors="replace")
+
+    if info.name in _BUILTIN_CODECS:
+        name = info.name
+
+        def decode(payload: bytes) -> str:
+            try:
+                return payload.decode(name)
+            except UnicodeDecodeError:
+                return payload.decode(name, errors="replace")
+    else:
+        codec_decode = info.decode
+
+        def decode(payload: bytes) -> str:
+            try:
+                return codec_decode(payload)[0]
+            except UnicodeDecodeError:
+                return codec_decode(payload, "replace")[0]
+
+    return decode
+
+
+class _EasySerialCounters:
+    """
+    Integer extra metrics of the Easy Serial worker.
+
+    Plain slot attributes instead of the shared extra-metrics dict: they are
+    only incremented by the worker thread, so `+=` needs neither a lock nor
+    a dict lookup. get_metrics() merges them into the "extra" section.
+    """
+
+    __slots__ = (
+        "bytes_read_total",
+        "frames_total",
+        "parse_ok_total",
+        "parse_fail_total",
+        "serial_open_fail_total",
+        "serial_reconnects_total",
+    )
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class EasySerialConnectionWorker(BaseConnectionWorker):
@@ -49,6 +135,14 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
 
     _READ_CHUNK_SIZE = 1024
     _RECONNECT_INTERVAL = 2.0  # seconds
+    _IDLE_READ_TIMEOUT = 0.1  # seconds, used when the port timeout is 0
+    _PARSE_CACHE_SIZE = 64  # recently parsed payloads (e.g. repeated heartbeats)
+
+    # Rows parsed by the read loop are written in batches (executemany):
+    # flushed at this many rows, after this long, or once no more input
+    # is buffered on the port
+    _BATCH_MAX_ROWS = 64
+    _BATCH_MAX_DELAY = 0.25  # seconds
 
     def __init__(
         self,
@@ -71,19 +165,26 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
         )
         self._db_writer = db_writer
 
+        # The parser settings are fixed for the worker's lifetime (a config
+        # change re-creates the worker), so parse results can be cached by text
+        parser_settings = self._es_config.parser
+        self._parse_cached = lru_cache(maxsize=self._PARSE_CACHE_SIZE)(
+            lambda text: parse_payload_text(text, parser_settings)
+        )
+
         self._serial: Optional[Serial] = None
         self._serial_lock = threading.Lock()
 
+        # (sql, params) rows waiting for the next batched DB write,
+        # and when the oldest of them was queued (time.monotonic())
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self._pending_since = 0.0
+
         # initialize extra metrics for monitoring
+        self._es_counters = _EasySerialCounters()
         self._init_extra_metrics({
-            "bytes_read_total": 0,
-            "frames_total": 0,
-            "parse_ok_total": 0,
-            "parse_fail_total": 0,
             "parse_latency_ms_last": None,
             "parse_latency_ms_avg": None,
-            "serial_open_fail_total": 0,
-            "serial_reconnects_total": 0,
         })
 
     # ---------------- Configuration Helpers ----------------
@@ -123,7 +224,7 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
             self._set_state(WorkerState.RUNNING)
 
             self._metric_inc("runs_total")
-            self._metric_set("started_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._metric_set("started_at", now_str())
 
             self._thread.start()
 
@@ -150,6 +251,11 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
         if self._db_writer is not None:
             self._db_writer.close()
 
+    def get_metrics(self) -> dict:
+        metrics = super().get_metrics()
+        metrics["extra"].update(self._es_counters.as_dict())
+        return metrics
+
     # ---------------- Serial Port Management ----------------
 
     def _open_serial(self) -> bool:
@@ -158,29 +264,9 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
         """
         port_cfg = self._es_config.port
 
-        # map user-friendly settings to pyserial constants
-        databits_map = {
-            5: serial.FIVEBITS,
-            6: serial.SIXBITS,
-            7: serial.SEVENBITS,
-            8: serial.EIGHTBITS,
-        }
-        parity_map = {
-            "None": serial.PARITY_NONE,
-            "Even": serial.PARITY_EVEN,
-            "Odd": serial.PARITY_ODD,
-            "Mark": serial.PARITY_MARK,
-            "Space": serial.PARITY_SPACE,
-        }
-        stopbits_map = {
-            1.0: serial.STOPBITS_ONE,
-            1.5: serial.STOPBITS_ONE_POINT_FIVE,
-            2.0: serial.STOPBITS_TWO,
-        }
-
-        databits = databits_map.get(port_cfg.databits, serial.EIGHTBITS)
-        parity = parity_map.get(port_cfg.parity, serial.PARITY_NONE)
-        stopbits = stopbits_map.get(float(port_cfg.stopbits), serial.STOPBITS_ONE)
+        databits = _DATABITS_MAP.get(port_cfg.databits, serial.EIGHTBITS)
+        parity = _PARITY_MAP.get(port_cfg.parity, serial.PARITY_NONE)
+        stopbits = _STOPBITS_MAP.get(float(port_cfg.stopbits), serial.STOPBITS_ONE)
 
         rtscts = port_cfg.flowcontrol == "RTSCTS"
         xonxoff = port_cfg.flowcontrol == "XONXOFF"
@@ -192,7 +278,8 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
                 bytesize=databits,
                 parity=parity,
                 stopbits=stopbits,
-                timeout=port_cfg.timeout,
+                # a zero (non-blocking) timeout would make the read loop spin
+                timeout=port_cfg.timeout if port_cfg.timeout > 0 else self._IDLE_READ_TIMEOUT,
                 rtscts=rtscts,
                 xonxoff=xonxoff,
             )
@@ -223,40 +310,60 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
             except Exception:
                 pass
 
-    def _read_from_serial(self) -> bytes:
-        """Read a chunk of bytes from the serial port."""
-        with self._serial_lock:
-            ser = self._serial
-        if ser is None or not ser.is_open:
-            return b""
+    def _read_from_serial(self, ser: Serial) -> Optional[bytes]:
+        """
+        Read a chunk of bytes from the given (open) serial port.
+
+        Reads what is already buffered (up to _READ_CHUNK_SIZE); if nothing
+        is, blocks for one byte up to the port timeout. So the call returns
+        as soon as data arrives and idles in the driver instead of polling.
+
+        Returns None after a read error; the port is closed in that case.
+        """
         try:
-            data = ser.read(self._READ_CHUNK_SIZE)
-            if data:
-                self._metric_inc("bytes_read_total", len(data), extra=True)
-            return data
-        except SerialException as exc:
+            waiting = ser.in_waiting
+            data = ser.read(min(waiting, self._READ_CHUNK_SIZE) if waiting else 1)
+        except (SerialException, OSError) as exc:
             msg = f"read error: {exc}"
             self._set_error(msg)
             self._close_serial()
-            return b""
+            return None
+        if data:
+            self._es_counters.bytes_read_total += len(data)
+        return data
+
+    @staticmethod
+    def _bytes_waiting(ser: Serial) -> int:
+        """
+        Number of received bytes not read yet (0 if the port cannot tell;
+        the next read reports the error).
+        """
+        try:
+            return ser.in_waiting
+        except (SerialException, OSError):
+            return 0
 
     # ---------------- Main Loop ----------------
 
     def _run_loop(self) -> None:
         """Main worker loop: connect, read, parse, write to DB."""
         try:
-            encoding = self._es_config.parser.encoding
+            decode = _payload_decoder(self._es_config.parser.encoding)
             autoconnect = self._es_config.port.autoconnect
+            stopped = self._stop_event.is_set
+            feed = self._framer.feed
+            counters = self._es_counters
 
-            while not self._stop_event.is_set():
-                # check if serial port is open
-                with self._serial_lock:
-                    ser_open = self._serial is not None and self._serial.is_open
+            # The port handle is kept in a local for the steady-state read
+            # path; _serial_lock only guards opening/closing it
+            ser: Optional[Serial] = None
 
-                if not ser_open:
+            while not stopped():
+                if ser is None or not ser.is_open:
                     # try opening the port
                     opened = self._open_serial()
                     if not opened:
+                        ser = None
                         if not autoconnect:
                             # no auto-reconnect — mark error and exit
                             self._set_error("failed to open port")
@@ -266,36 +373,39 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
                         self._set_error("failed to open port, will retry...")
                         time.sleep(self._RECONNECT_INTERVAL)
                         continue
+                    ser = self._serial
 
                 # read bytes
-                data = self._read_from_serial()
+                data = self._read_from_serial(ser)
+                if data is None:
+                    ser = None
+                    continue
                 if data:
-                    frames = self._framer.feed(data)
-                    self._metric_inc("frames_total", len(frames), extra=True)
+                    frames = feed(data)
+                    counters.frames_total += len(frames)
                     for payload in frames:
                         try:
-                            text = payload.decode(encoding, errors="replace")
+                            text = decode(payload)
                             self._log_message(text)
 
                             # parse payload and update metrics
-                            def do_parse():
-                                return parse_payload_text(text, self._es_config.parser)
-
-                            parsed = self._metric_time_block(
-                                "parse_latency_ms_last",
-                                "parse_latency_ms_avg",
-                                do_parse,
-                                extra=True,
-                            )
-
-                            self._metric_inc("parse_ok_total", extra=True)
-                            self._handle_parsed_message(parsed)
+                            with self._timed("parse_latency_ms_last", "parse_latency_ms_avg", extra=True):
+                                parsed = self._parse_payload(text)
+
+                            counters.parse_ok_total += 1
+                            self._queue_parsed_message(parsed)
                         except Exception as parse_exc:
                             self._set_error(f"parse error: {parse_exc}")
-                            self._metric_inc("parse_fail_total", extra=True)
-                else:
-                    # no data — sleep briefly to avoid busy loop
-                    time.sleep(0.01)
+                            counters.parse_fail_total += 1
+
+                # flush before the next read would block on an idle port
+                pending = self._pending
+                if pending and (
+                    not self._bytes_waiting(ser)
+                    or len(pending) >= self._BATCH_MAX_ROWS
+                    or time.monotonic() - self._pending_since >= self._BATCH_MAX_DELAY
+                ):
+                    self._flush_pending()
 
             # normal stop
             self._set_state(WorkerState.STOPPED)
@@ -303,43 +413,99 @@ class EasySerialConnectionWorker(BaseConnectionWorker):
             self._set_error(str(exc))
             self._set_state(WorkerState.ERROR)
         finally:
-            self._metric_set("stopped_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._flush_pending()
+            self._metric_set("stopped_at", now_str())
             self._close_serial()
             if self.state not in (WorkerState.STOPPED, WorkerState.ERROR):
                 self._set_state(WorkerState.STOPPED)
 
     # ---------------- Parsed Message Handling ----------------
 
-    def _handle_parsed_message(self, parsed: Dict[str, Any]) -> None:
+    def _parse_payload(self, text: str) -> Dict[str, Any]:
         """
-        Process a parsed payload:
-        - log it
-        - optionally build SQL and write to DB
+        Parses a payload, reusing the result for recently seen texts.
+        Returns a copy, so callers cannot change the cached dict.
+        """
+        return dict(self._parse_cached(text))
+
+    def _build_db_row(self, parsed: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Logs a parsed payload and returns (sql, params) to write,
+        or None if nothing should be written to the DB.
         """
         if not self._config.enabled:
             self._log_message(f"EasySerial payload: {parsed}")
-            return
+            return None
 
         if not self._config.query_template or self._db_writer is None:
             # no DB write configured, can log or count dropped messages
-            return
+            return None
 
         sql, params = build_query(self._config.query_template, parsed)
         self._log_message(f"DB write: {params}")
+        return sql, params
+
+    def _handle_parsed_message(self, parsed: Dict[str, Any]) -> None:
+        """
+        Process a parsed payload:
+        - log it
+        - optionally build SQL and write to DB (immediately)
+        """
+        row = self._build_db_row(parsed)
+        if row is not None:
+            self._write_rows(row[0], [row[1]])
+
+    def _queue_parsed_message(self, parsed: Dict[str, Any]) -> None:
+        """
+        Same as _handle_parsed_message(), but the DB write is queued for the
+        next _flush_pending() call of the read loop.
+        """
+        row = self._build_db_row(parsed)
+        if row is not None:
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append(row)
+
+    def _flush_pending(self) -> None:
+        """
+        Writes queued rows, one executemany per run of rows with the same SQL.
+        """
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
 
-        def do_write():
-            self._db_writer.write(sql, params)
+        start = 0
+        for i in range(1, len(pending) + 1):
+            if i == len(pending) or pending[i][0] != pending[start][0]:
+                self._write_rows(pending[start][0], [params for _, params in pending[start:i]])
+                start = i
+
+    def _write_rows(self, sql: str, params_list: List[Dict[str, Any]]) -> None:
+        """
+        Writes rows in one DB call and updates DB metrics.
 
+        If a batch fails, its rows are retried one by one, so a single bad
+        row does not drop the others and each failure is reported. A lost
+        connection fails every row alike, so then the batch is not retried
+        and all of its rows are counted as failed.
+        """
         try:
-            self._metric_time_block(
-                "db_write_latency_ms_last",
-                "db_write_latency_ms_avg",
-                do_write,
-                extra=False,
-            )
-            self._metric_set("last_db_write_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
-            self._metric_inc("db_writes_total")
+            with self._timed("db_write_latency_ms_last", "db_write_latency_ms_avg"):
+                if len(params_list) == 1:
+                    self._db_writer.write(sql, params_list[0])
+                else:
+                    self._db_writer.write_many(sql, params_list)
+            self._metric_set("last_db_write_at", now_str())
+            self._metric_inc("db_writes_total", len(params_list))
         except Exception as exc:
-            self._metric_set("last_db_error_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
-            self._metric_inc("db_write_fail_total")
-            self._set_error(f"db write error: {exc}")
+            if len(params_list) > 1 and not is_connection_error(exc):
+                for params in params_list:
+                    self._write_rows(sql, [params])
+                return
+            self._metric_set("last_db_error_at", now_str())
+            self._metric_inc("db_write_fail_total", len(params_list))
+            if len(params_list) > 1:
+                self._set_error(f"db write error ({len(params_list)} rows): {exc}")
+            else:
+                self._set_error(f"db write error: {exc}")
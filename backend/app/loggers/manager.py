@@ -21,10 +21,11 @@ from backend.app.loggers.mbox_counter.worker import MboxCounterConnectionWorker
 from backend.app.loggers.modbus_rtu.worker import ModbusRtuConnectionWorker
 from backend.app.loggers.modbus_tcp.worker import ModbusTcpConnectionWorker
 from backend.app.schemas.db_settings import DbSettings
-from backend.app.core.db_writer import BaseDBWriter, SQLAlchemyDBWriter
+from backend.app.core.db_writer import BaseDBWriter, SQLAlchemyDBWriter, dispose_all_engines
 
 
 DBWriterFactory = Callable[[DbSettings, LoggerConnectionConfig], Optional[BaseDBWriter]]
+CounterTotalGetter = Callable[[int], Optional[int]]
 
 
 class ConnectionRuntimeManager:
@@ -39,6 +40,8 @@ class ConnectionRuntimeManager:
     ) -> None:
         self._base_db_settings = base_db_settings
         self._workers: Dict[int, BaseConnectionWorker] = {}
+        # conn_id -> bound worker.get_total, for workers that expose counters
+        self._counter_getters: Dict[int, CounterTotalGetter] = {}
         self._lock = threading.Lock()
         self._db_writer_factory: DBWriterFactory = db_writer_factory or self._default_db_writer_factory
 
@@ -121,6 +124,11 @@ class ConnectionRuntimeManager:
             if worker is None:
                 worker = self._create_worker_for_config(config)
                 self._workers[config.id] = worker
+
+                # We don’t import the class explicitly — duck typing is enough
+                get_total = getattr(worker, "get_total", None)
+                if callable(get_total):
+                    self._counter_getters[config.id] = get_total
             return worker
 
     def start_connection(self, conn_id: int) -> None:
@@ -151,11 +159,20 @@ class ConnectionRuntimeManager:
         """
         with self._lock:
             self._workers.pop(conn_id, None)
+            self._counter_getters.pop(conn_id, None)
 
     def get_worker(self, conn_id: int) -> Optional[BaseConnectionWorker]:
         with self._lock:
             return self._workers.get(conn_id)
 
+    def get_counter_total_getter(self, conn_id: int) -> Optional[CounterTotalGetter]:
+        """
+        Returns the bound get_total(device_id) of a registered counter worker,
+        or None if the worker is missing or does not expose counters.
+        """
+        with self._lock:
+            return self._counter_getters.get(conn_id)
+
     def get_state(self, conn_id: int) -> Optional[WorkerState]:
         worker = self.get_worker(conn_id)
         return worker.state if worker is not None else None
@@ -176,19 +193,22 @@ class ConnectionRuntimeManager:
 
         with self._lock:
             self._workers.clear()
+            self._counter_getters.clear()
+
+        # Release pooled DB connections, including ones held by writers of
+        # workers that did not stop within the timeout
+        dispose_all_engines()
 
     def _get_mbox_counter_total(self, counter_conn_id: int, device_id: int) -> Optional[int]:
         """
         Returns total_count from an mbox_counter worker if it is running/registered.
         """
-        w = self.get_worker(counter_conn_id)
-        if w is None:
+        # Bound get_total cached at registration; a single dict read is
+        # atomic, so no lock is taken on this per-frame path
+        get_total = self._counter_getters.get(counter_conn_id)
+        if get_total is None:
+            return None
+        try:
+            return get_total(device_id)
+        except Exception:
             return None
-        # We don’t import the class explicitly — duck typing is enough
-        get_total = getattr(w, "get_total", None)
-        if callable(get_total):
-            try:
-                return get_total(device_id)
-            except Exception:
-                return None
-        return None
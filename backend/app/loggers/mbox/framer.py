@@ -22,6 +22,10 @@ from typing import List
 
 STX = 0x02
 ETX = 0x03
+MARKER = ord("$")
+
+# Consumed bytes are dropped from the buffer once there are this many
+_COMPACT_THRESHOLD = 4096
 
 
 class MboxFramer:
@@ -35,11 +39,16 @@ class MboxFramer:
     - Drop malformed or out-of-sync data safely
 
     The framer is stateful and intended to be reused across reads.
+    Consumed bytes are skipped with a read offset (_head) and only
+    removed from the buffer once they pile up, instead of memmoving the
+    buffer after every frame.
     """
 
     def __init__(self) -> None:
         # Internal rolling buffer with unprocessed bytes
         self._buf = bytearray()
+        # Offset of the first unprocessed byte in _buf
+        self._head = 0
 
     def feed(self, data: bytes) -> List[bytes]:
         """
@@ -53,45 +62,50 @@ class MboxFramer:
             return frames
 
         # Append new data to the internal buffer
-        self._buf.extend(data)
-
-        while True:
-            # 1) Search for STX (start of frame)
-            try:
-                stx_idx = self._buf.index(STX)
-            except ValueError:
-                # No STX found — buffer contains only garbage
-                # Clear it to prevent uncontrolled growth
-                self._buf.clear()
-                return frames
-
-            # If STX is not at position 0, drop leading garbage bytes
-            if stx_idx > 0:
-                del self._buf[:stx_idx]
-
-            # We need at least: STX + '$' + something (ETX or payload)
-            if len(self._buf) < 3:
-                return frames
-
-            # 2) Validate protocol marker after STX
-            if self._buf[1] != ord("$"):
-                # Invalid frame start — discard STX and retry sync
-                del self._buf[0]
-                continue
-
-            # 3) Search for ETX (end of frame), starting after '$'
-            try:
-                etx_idx = self._buf.index(ETX, 2)
-            except ValueError:
-                # Frame not complete yet — wait for more data
-                return frames
-
-            # 4) Extract payload (raw bytes between '$' and ETX)
-            payload = bytes(self._buf[2:etx_idx])
-            frames.append(payload)
-
-            # 5) Remove processed frame from the buffer
-            del self._buf[: etx_idx + 1]
-            # Continue loop to check for more frames in buffer
-
-        # unreachable
+        buf = self._buf
+        buf.extend(data)
+        find = buf.find
+        head = self._head
+
+        # Payloads are copied once, straight from a view of the buffer
+        # (slicing the bytearray first would copy them twice)
+        with memoryview(buf) as view:
+            while True:
+                # 1) Search for STX (start of frame), dropping leading garbage
+                stx_idx = find(STX, head)
+                if stx_idx == -1:
+                    # No STX found — buffer contains only garbage;
+                    # mark all of it consumed so it is dropped below
+                    head = len(buf)
+                    break
+                head = stx_idx
+
+                # We need at least: STX + '$' + something (ETX or payload)
+                if len(buf) - head < 3:
+                    break
+
+                # 2) Validate protocol marker after STX
+                if buf[head + 1] != MARKER:
+                    # Invalid frame start — discard STX and retry sync
+                    head += 1
+                    continue
+
+                # 3) Search for ETX (end of frame), starting after '$'
+                etx_idx = find(ETX, head + 2)
+                if etx_idx == -1:
+                    # Frame not complete yet — wait for more data
+                    break
+
+                # 4) Extract payload (raw bytes between '$' and ETX)
+                frames.append(bytes(view[head + 2:etx_idx]))
+
+                # 5) Mark the frame as processed
+                head = etx_idx + 1
+                # Continue loop to check for more frames in buffer
+
+        # Drop the processed prefix once it is large (or most of the buffer)
+        if head and (head > _COMPACT_THRESHOLD or head > len(buf) // 2):
+            del buf[:head]
+            head = 0
+        self._head = head
+        return frames
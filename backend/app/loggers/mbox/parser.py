@@ -11,10 +11,68 @@ The protocol format is CSV-like and position-based.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Iterable, List, Optional
 
 
-@dataclass
+_TS_FORMAT = "%Y%m%d%H%M%S%f"
+_TS_LEN = 17  # YYYYMMDDhhmmssmmm
+
+# Fields 0..10 are used; everything after field 10 is left unsplit in one
+# trailing element, which is never looked at.
+_MIN_FIELDS = 11
+_MAX_SPLIT = _MIN_FIELDS
+
+# timestamp, fish type, serial number, size, net weight, real weight
+_GET_FIELDS = itemgetter(0, 6, 7, 8, 9, 10)
+
+# First characters a weight field may start with (as bytes and as str),
+# used to reject garbage before float() has to raise.
+_NUM_PREFIX = frozenset(
+    [bytes([c]) for c in b" \t-+.0123456789"] + list(" \t-+.0123456789")
+)
+
+
+def _parse_timestamp(ts_raw: str) -> datetime:
+    """
+    Parse a YYYYMMDDhhmmssmmm timestamp.
+
+    The regular 17-digit form is rearranged into basic ISO 8601
+    (YYYYMMDDThhmmss.mmm) and handed to the C-implemented fromisoformat(),
+    which is much cheaper than strptime; anything else goes through strptime.
+
+    The 17-digit form is read at fixed offsets, so it is stricter than
+    strptime: a field out of range (e.g. month 13 in "20241304080731779")
+    raises instead of being re-split by strptime's variable-width matching
+    into a different, wrong datetime.
+
+    :raises ValueError: If the timestamp is invalid
+    """
+    if len(ts_raw) == _TS_LEN and ts_raw.isascii() and ts_raw.isdigit():
+        return datetime.fromisoformat(f"{ts_raw[:8]}T{ts_raw[8:14]}.{ts_raw[14:]}")
+    return datetime.strptime(ts_raw, _TS_FORMAT)
+
+
+# Used by the batch path, where replayed logs repeat timestamps verbatim.
+# The live path stays uncached: its timestamps are practically unique and
+# a cache miss costs more than the parse saves.
+_parse_timestamp_cached = lru_cache(maxsize=2048)(_parse_timestamp)
+
+
+@lru_cache(maxsize=16)
+def _splits_as_bytes(encoding: str) -> bool:
+    """
+    True if the payload can be split on b"," before decoding, i.e. the
+    encoding writes "," as a single 0x2C byte (ASCII, UTF-8, cp125x, ...).
+    """
+    try:
+        return ",".encode(encoding) == b","
+    except LookupError:
+        return False
+
+
+@dataclass(slots=True)
 class MboxLabelRecord:
     """
     Parsed result of a single MBox label frame.
@@ -49,7 +107,8 @@ def parse_label_frame(payload: bytes, encoding: str = "ascii") -> MboxLabelRecor
         (remaining fields are ignored)
 
     Notes:
-    - Payload is decoded using the provided encoding (default: ASCII)
+    - Payload is decoded using the provided encoding (default: ASCII);
+      for ASCII-compatible encodings only the returned fields are decoded
     - The parser is strict and positional
     - Any format or conversion error results in ValueError
 
@@ -58,42 +117,128 @@ def parse_label_frame(payload: bytes, encoding: str = "ascii") -> MboxLabelRecor
     :return: Parsed MboxLabelRecord
     :raises ValueError: On decode, format, or conversion errors
     """
-    # Decode raw bytes into text
-    try:
-        text = payload.decode(encoding).strip()
-    except Exception as exc:
-        raise ValueError(f"decode error: {exc}") from exc
+    return make_label_parser(encoding)(payload)
 
-    # Split CSV fields
-    parts = text.split(",")
 
-    # We rely on fixed field positions, so the length must be sufficient
-    if len(parts) < 10:
-        raise ValueError(f"expected at least 10 fields, got {len(parts)}")
+@lru_cache(maxsize=16)
+def make_label_parser(encoding: str = "ascii") -> Callable[[bytes], MboxLabelRecord]:
+    """
+    Return a parse_label_frame() equivalent specialised for one encoding.
 
+    Long-running callers (the worker) build it once and call it per frame.
 
-    # Field 0 — timestamp in YYYYMMDDhhmmssmmm format
-    ts_raw = parts[0]
-    try:
-        dt = datetime.strptime(ts_raw, "%Y%m%d%H%M%S%f")
-    except ValueError as exc:
-        raise ValueError(f"invalid datetime '{ts_raw}'") from exc
+    :param encoding: Character encoding used by the device
+    :return: Callable taking the payload bytes and returning MboxLabelRecord
+    """
+    return _build_label_parser(encoding, _parse_timestamp)
 
-    # Weight fields (numeric)
-    try:
-        n_weight = float(parts[9])
-        r_weight = float(parts[10])
-    except ValueError as exc:
-        raise ValueError("invalid weight value") from exc
-
-    # Construct structured result
-    record = MboxLabelRecord(
-        dt=dt,
-        sFishType=parts[6].strip(),
-        sSize=parts[8].strip(),
-        nWeight=n_weight,
-        rWeight=r_weight,
-        sSNumber=parts[7].strip(),
-    )
-
-    return record
+
+def parse_label_frames_batch(
+    payloads: Iterable[bytes], encoding: str = "ascii"
+) -> List[MboxLabelRecord]:
+    """
+    Parse many MBox frame payloads at once (log replay / backfill).
+
+    Each payload is parsed exactly like parse_label_frame(); repeated
+    timestamps are served from a bounded LRU cache.
+
+    :param payloads: Raw payloads extracted by the framer
+    :param encoding: Character encoding used by the device
+    :return: Parsed records, in input order
+    :raises ValueError: On the first malformed payload (with its index)
+    """
+    parse = _build_label_parser(encoding, _parse_timestamp_cached)
+    records: List[MboxLabelRecord] = []
+    append = records.append
+    for index, payload in enumerate(payloads):
+        try:
+            append(parse(payload))
+        except ValueError as exc:
+            raise ValueError(f"frame {index}: {exc}") from exc
+    return records
+
+
+def _build_label_parser(
+    encoding: str, parse_ts: Callable[[str], datetime]
+) -> Callable[[bytes], MboxLabelRecord]:
+    """
+    Build a label parser bound to one encoding and timestamp parser.
+
+    The encoding check is made once here: ASCII-compatible encodings get a
+    parser that splits the raw bytes, the rest one that decodes first. The
+    helpers used per frame are bound as closure variables / default
+    arguments instead of being looked up as globals on every call.
+    """
+
+    def build_record(
+        ts_raw: str,
+        fish_type: str,
+        serial_number: str,
+        size: str,
+        n_raw: Any,
+        r_raw: Any,
+        _num_prefix=_NUM_PREFIX,
+        _float=float,
+        _record=MboxLabelRecord,
+    ) -> MboxLabelRecord:
+        # Field 0 — timestamp in YYYYMMDDhhmmssmmm format
+        try:
+            dt = parse_ts(ts_raw)
+        except ValueError as exc:
+            raise ValueError(f"invalid datetime '{ts_raw}'") from exc
+
+        # Weight fields (numeric)
+        if n_raw[:1] not in _num_prefix or r_raw[:1] not in _num_prefix:
+            raise ValueError("invalid weight value")
+        try:
+            n_weight = _float(n_raw)
+            r_weight = _float(r_raw)
+        except ValueError as exc:
+            raise ValueError("invalid weight value") from exc
+
+        # Construct structured result
+        return _record(dt, fish_type, size, n_weight, r_weight, serial_number)
+
+    def parse_bytes(
+        payload: bytes, _get_fields=_GET_FIELDS, _build=build_record
+    ) -> MboxLabelRecord:
+        # Split the raw bytes and decode only the fields that are returned
+        parts = payload.strip().split(b",", _MAX_SPLIT)
+
+        # We rely on fixed field positions, so the length must be sufficient
+        if len(parts) < _MIN_FIELDS:
+            raise ValueError(f"expected at least {_MIN_FIELDS} fields, got {len(parts)}")
+
+        ts_raw, fish_type, serial_number, size, n_raw, r_raw = _get_fields(parts)
+        try:
+            ts_raw = ts_raw.decode("ascii")
+            fish_type = fish_type.strip().decode(encoding)
+            serial_number = serial_number.strip().decode(encoding)
+            size = size.strip().decode(encoding)
+        except UnicodeDecodeError as exc:
+            raise ValueError(f"decode error: {exc}") from exc
+
+        return _build(ts_raw, fish_type, serial_number, size, n_raw, r_raw)
+
+    def parse_text(
+        payload: bytes, _get_fields=_GET_FIELDS, _build=build_record
+    ) -> MboxLabelRecord:
+        # Decode raw bytes into text
+        try:
+            text = payload.decode(encoding).strip()
+        except Exception as exc:
+            raise ValueError(f"decode error: {exc}") from exc
+
+        # Split CSV fields
+        parts = text.split(",", _MAX_SPLIT)
+
+        # We rely on fixed field positions, so the length must be sufficient
+        if len(parts) < _MIN_FIELDS:
+            raise ValueError(f"expected at least {_MIN_FIELDS} fields, got {len(parts)}")
+
+        ts_raw, fish_type, serial_number, size, n_raw, r_raw = _get_fields(parts)
+        return _build(
+            ts_raw, fish_type.strip(), serial_number.strip(), size.strip(), n_raw, r_raw
+        )
+
+    return parse_bytes if _splits_as_bytes(encoding) else parse_text
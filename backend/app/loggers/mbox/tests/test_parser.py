@@ -73,3 +73,48 @@ def test_parse_bad_weights():
     )
     with pytest.raises(ValueError):
         parse_label_frame(payload)
+
+
+def test_parse_timestamp_matches_strptime():
+    """
+    Fixed-offset timestamp parsing must agree with strptime on well-formed
+    values, including the fallback for non-17-digit values.
+    """
+    from backend.app.loggers.mbox.parser import _parse_timestamp
+
+    for ts in ("20240101123015999", "20241231235959000", "2024010112301599"):
+        assert _parse_timestamp(ts) == datetime.strptime(ts, "%Y%m%d%H%M%S%f")
+
+    with pytest.raises(ValueError):
+        _parse_timestamp("20240230123015999")
+
+
+def test_parse_timestamp_rejects_out_of_range_fields():
+    """
+    A 17-digit timestamp with an out-of-range field must raise, even where
+    strptime would re-split the digits into some other valid datetime.
+    """
+    from backend.app.loggers.mbox.parser import _parse_timestamp
+
+    ts = "20241304080731779"
+    assert datetime.strptime(ts, "%Y%m%d%H%M%S%f") == datetime(2024, 1, 30, 4, 8, 7, 317790)
+
+    with pytest.raises(ValueError):
+        _parse_timestamp(ts)
+
+
+def test_parse_batch_matches_single_frames():
+    """
+    Batch parsing must return the same records as parsing frames one by one
+    and report the index of a malformed frame.
+    """
+    from backend.app.loggers.mbox.parser import parse_label_frames_batch
+
+    payloads = [
+        make_payload("20240101123015999,X,X,X,X,X,MACKEREL,SN1,M,12.5,13.1"),
+        make_payload("20240101123015999,X,X,X,X,X,HERRING,SN2,L,1.0,2.0"),
+    ]
+    assert parse_label_frames_batch(payloads) == [parse_label_frame(p) for p in payloads]
+
+    with pytest.raises(ValueError, match="frame 1"):
+        parse_label_frames_batch([payloads[0], make_payload("20240101,ABC")])
@@ -11,27 +11,70 @@ The transformer is stateful: it remembers the last adjusted weight
 to detect duplicates.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
-from backend.app.loggers.mbox.parser import MboxLabelRecord
+from backend.app.loggers.mbox.parser import MboxLabelRecord, make_label_parser
 from backend.app.loggers.mbox.config import MboxConfig
 
 
-@dataclass
+# Key layout of MboxTransformResult.variables. Copying a prebuilt dict and
+# overwriting the values is cheaper than building the 11-key literal.
+_VARS_TEMPLATE: Dict[str, Any] = {
+    "mbox_id": 0,
+    "on_error": False,
+    "created_at": None,
+    "fish_name": "",
+    "fish_grade": "",
+    "lot": "",
+    "n_weight": 0.0,
+    "r_weight": 0.0,
+    "sn": "",
+
+    "error_info": "",
+    "tare": 0.0,
+}
+
+
+@dataclass(slots=True)
 class MboxTransformResult:
     """
     Result of domain-level transformation.
 
     - variables: dictionary passed directly to query_template
+      (built on first access, so records that are never written
+      do not pay for it)
     - on_error: indicates whether the record is considered erroneous
     - error_info: human-readable error description
     - adj_r_weight: adjusted real weight (after tare and clamping)
     """
-    variables: Dict[str, Any]
+    mbox_id: int
+    rec: MboxLabelRecord
     on_error: bool
     error_info: str
     adj_r_weight: float
+    tare: float
+    _variables: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def variables(self) -> Dict[str, Any]:
+        variables = self._variables
+        if variables is None:
+            rec = self.rec
+            variables = _VARS_TEMPLATE.copy()
+            variables["mbox_id"] = self.mbox_id
+            variables["on_error"] = self.on_error
+            variables["created_at"] = rec.dt
+            variables["fish_name"] = rec.sFishType
+            variables["fish_grade"] = rec.sSize
+            variables["n_weight"] = rec.nWeight
+            variables["r_weight"] = self.adj_r_weight
+            variables["sn"] = rec.sSNumber
+            variables["error_info"] = self.error_info
+            variables["tare"] = self.tare
+            self._variables = variables
+        return variables
 
 
 class MboxTransformer:
@@ -56,70 +99,90 @@ class MboxTransformer:
         """
         self._cfg = config
         self._last_adj_r_weight: Optional[float] = None
+        self.reload_config()
 
     def reset_state(self) -> None:
         self._last_adj_r_weight = None
 
+    def reload_config(self, config: Optional[MboxConfig] = None) -> None:
+        """
+        Re-read configuration values used by transform().
+
+        The values are cached on the instance so transform() does not go
+        through the config model for every record; call this after the
+        config changes (optionally passing the new config).
+        """
+        if config is not None:
+            self._cfg = config
+        cfg = self._cfg
+        self._tare = float(cfg.tare)
+        self._zero_err = bool(cfg.treat_zero_as_error)
+        self._dup_err = bool(cfg.treat_duplicate_as_error)
+        # Interned: the same label object is put into every error record
+        self._lbl_zero = sys.intern(cfg.error_label_zero)
+        self._lbl_dup = sys.intern(cfg.error_label_duplicate)
+        self._parse = make_label_parser(cfg.encoding)
+
+    def parse_and_transform(self, mbox_id: int, payload: bytes) -> MboxTransformResult:
+        """
+        Parse a raw MBox payload and apply domain rules in one call.
+
+        The payload is parsed with the parser specialised for the configured
+        encoding (see parser.make_label_parser).
+
+        :param mbox_id: Logical MBox identifier
+        :param payload: Raw payload bytes extracted by the framer
+        :return: Transformation result
+        :raises ValueError: On decode, format, or conversion errors
+        """
+        return self.transform(mbox_id, self._parse(payload))
+
     def transform(self, mbox_id: int, rec: MboxLabelRecord) -> MboxTransformResult:
         """
         Apply domain rules to a parsed MBox record.
 
         Steps:
-        1) Apply tare to real weight and clamp to zero
+        1) Apply tare to real weight (clamped to zero)
         2) Detect error conditions according to configuration
         3) Update internal state
-        4) Build variables dictionary for SQL insertion
+        4) Return the result (SQL variables are built on first access)
 
         :param mbox_id: Logical MBox identifier
         :param rec: Parsed MBox label record
         :return: Transformation result
         """
-        cfg = self._cfg
-
-        # 1) Apply tare and clamp negative values
-        adj_r = rec.rWeight - float(cfg.tare)
-        if adj_r < 0:
-            adj_r = 0.0
+        tare = self._tare
 
-        # 2) Error detection
+        # 1) Apply tare; the common case (positive weight) skips the
+        #    clamp and zero-weight checks with a single comparison
+        adj_r = rec.rWeight - tare
         on_error = False
         error_info = ""
 
-        # Zero-weight detection
-        if cfg.treat_zero_as_error and adj_r == 0.0:
-            # Fallback to net weight
-            adj_r = rec.nWeight
-            on_error = True
-            error_info = cfg.error_label_zero
-
-        # Duplicate-weight detection (stateful)
-        if (not on_error) and cfg.treat_duplicate_as_error:
-            if self._last_adj_r_weight is not None and adj_r == self._last_adj_r_weight:
+        if adj_r <= 0.0:
+            # 2a) Zero-weight detection (negative values clamp to zero)
+            if self._zero_err:
+                # Fallback to net weight
+                adj_r = rec.nWeight
                 on_error = True
-                error_info = cfg.error_label_duplicate
+                error_info = self._lbl_zero
+            elif adj_r < 0.0:
+                adj_r = 0.0
+
+        # 2b) Duplicate-weight detection (stateful)
+        if not on_error and self._dup_err and adj_r == self._last_adj_r_weight:
+            on_error = True
+            error_info = self._lbl_dup
 
         # 3) Update state after processing
         self._last_adj_r_weight = adj_r
 
-        # 4) Build variables for query_template
-        variables: Dict[str, Any] = {
-            "mbox_id": mbox_id,
-            "on_error": on_error,
-            "created_at": rec.dt,
-            "fish_name": rec.sFishType,
-            "fish_grade": rec.sSize,
-            "lot": '',
-            "n_weight": rec.nWeight,
-            "r_weight": adj_r if adj_r is not None else rec.nWeight,
-            "sn": rec.sSNumber,
-
-            "error_info": error_info,
-            "tare": float(cfg.tare),
-        }
-
+        # 4) Variables for query_template are built lazily by the result
         return MboxTransformResult(
-            variables=variables,
+            mbox_id=mbox_id,
+            rec=rec,
             on_error=on_error,
             error_info=error_info,
             adj_r_weight=adj_r,
+            tare=tare,
         )
@@ -16,8 +16,8 @@ This module implements a full serial-processing pipeline for MBox devices:
     serial.read(bytes)
         -> MboxFramer
         -> payload (raw bytes)
-        -> parse_label_frame
-        -> MboxTransformer (domain logic)
+        -> MboxTransformer.parse_and_transform
+           (parse_label_frame + domain logic)
         -> build_query
         -> DBWriter
 
@@ -29,29 +29,32 @@ Additionally, the worker optionally integrates with an external counter:
 The worker is stateful and runs in its own background thread.
 """
 
+import queue
 import threading
 import time
-from typing import Optional, Callable
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Callable, Tuple
 
 import serial
 from serial import Serial, SerialException
 
-from backend.app.loggers.base import BaseConnectionWorker, WorkerState
+from backend.app.loggers.base import BaseConnectionWorker, WorkerState, now_str
 from backend.app.loggers.models import LoggerConnectionConfig, ConnectionType
 from backend.app.loggers.mbox.config import MboxConfig
 from backend.app.loggers.mbox.framer import MboxFramer
-from backend.app.loggers.mbox.parser import parse_label_frame
 from backend.app.loggers.mbox.transform import MboxTransformer
 from backend.app.core.query_template import build_query
-from backend.app.core.db_writer import BaseDBWriter
+from backend.app.core.db_writer import BaseDBWriter, is_connection_error
 
 # External counter provider:
 # (connection_id, device_id) -> total_count or None
 CounterTotalProvider = Callable[[int, int], Optional[int]]
+# Queued DB write: (sql, params, transform variables or None for a miss pack)
+_DbItem = Tuple[str, Dict[str, Any], Optional[dict]]
 # Default SQL template (may be overridden by config.query_template)
 _MBOX_QUERY_TEMPLATE = ("INSERT INTO storehouse_view VALUES (DEFAULT, DEFAULT, DEFAULT, {mbox_id}, {on_error}, NULL, "
                         "{created_at}, {fish_name}, {fish_grade}, {lot}, {n_weight}, {r_weight}, {sn}, {error_info}, {tare})")
+# created_at format for synthetic "missed" packets
+_SQL_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 
@@ -67,8 +70,17 @@ class MboxConnectionWorker(BaseConnectionWorker):
     - write resulting records to the database
     """
 
-    _READ_CHUNK_SIZE = 1024
+    _READ_CHUNK_SIZE = 8192
     _RECONNECT_INTERVAL = 2.0
+    # Pause after an empty read (matters when the port timeout is 0)
+    _IDLE_WAIT = 0.005
+    # DB writes are handed to a writer thread (see _db_loop)
+    _DB_QUEUE_SIZE = 1024
+    _DB_BATCH_MAX_ROWS = 64
+    # How long a row may wait for room in a full queue before it is dropped
+    _DB_PUT_TIMEOUT = 0.5
+    # How long stopping waits for queued rows to be written; the rest is dropped
+    _DB_DRAIN_TIMEOUT = 1.0
 
     def __init__(
         self,
@@ -104,6 +116,34 @@ class MboxConnectionWorker(BaseConnectionWorker):
         self._miss_deadline_ts: Optional[float] = None  # waiting before inserting miss pack
         self._pending_miss: int = 0
         self._last_good_vars: Optional[dict] = None
+        # Counter settings, read once instead of on every loop iteration
+        cfg = self._mbox_cfg
+        self._ext_counter_enabled = bool(getattr(cfg, "ext_counter", False))
+        counter_conn_id = getattr(cfg, "counter_connection_id", None)
+        counter_device_id = getattr(cfg, "counter_device_id", None)
+        self._counter_conn_id = None if counter_conn_id is None else int(counter_conn_id)
+        self._counter_device_id = None if counter_device_id is None else int(counter_device_id)
+        self._clean_timeout = float(getattr(cfg, "counter_clean_timeout", 6.0))
+        self._miss_timeout = float(getattr(cfg, "counter_miss_timeout", 4.0))
+        self._miss_limit = max(int(getattr(cfg, "miss_insert_limit", 1)), 1)
+
+        # Values every synthetic "missed" pack overrides
+        self._miss_fixed_vars = {
+            "mbox_id": cfg.mbox_id,
+            "tare": cfg.tare,
+            "lot": cfg.lot,
+            "on_error": True,
+            "error_info": cfg.miss_error_label,
+        }
+
+        # DB writer thread state
+        self._db_queue: "queue.Queue[Optional[_DbItem]]" = queue.Queue(maxsize=self._DB_QUEUE_SIZE)
+        self._db_thread: Optional[threading.Thread] = None
+        self._db_thread_lock = threading.Lock()
+        self._db_drain_deadline: Optional[float] = None
+        # Set by close() while the writer thread is still busy; it then
+        # closes the DB writer itself when it exits
+        self._db_close_pending = False
 
         # Extra metrics
         self._init_extra_metrics({
@@ -117,6 +157,7 @@ class MboxConnectionWorker(BaseConnectionWorker):
             "packs_miss_total": 0,
             "counter_increments_total": 0,
             "counter_confirm_total": 0,
+            "db_rows_dropped_total": 0,
         })
 
     # ---------------- config helpers ----------------
@@ -152,7 +193,7 @@ class MboxConnectionWorker(BaseConnectionWorker):
             self._set_state(WorkerState.RUNNING)
 
             self._metric_inc("runs_total")
-            self._metric_set("started_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._metric_set("started_at", now_str())
 
             self._thread.start()
 
@@ -176,9 +217,16 @@ class MboxConnectionWorker(BaseConnectionWorker):
     def close(self) -> None:
         """
         Release resources.
+
+        If the DB writer thread is still running (stuck in a DB call past
+        the stop timeout), the DB writer is closed by that thread on exit.
         """
         self._close_serial()
         if self._db_writer:
+            with self._db_thread_lock:
+                if self._db_thread is not None:
+                    self._db_close_pending = True
+                    return
             self._db_writer.close()
 
     # ---------------- serial helpers ----------------
@@ -243,14 +291,20 @@ class MboxConnectionWorker(BaseConnectionWorker):
     def _read_serial(self) -> bytes:
         """
         Read raw bytes from serial port.
+
+        Reads what is already buffered (up to _READ_CHUNK_SIZE); if nothing
+        is, blocks for one byte up to the port timeout, so the call returns
+        as soon as data arrives instead of waiting for a full chunk.
         """
-        with self._serial_lock:
-            ser = self._serial
-        if not ser or not ser.is_open:
+        # A plain attribute read is atomic; the lock only serializes
+        # opening/closing. A port closed meanwhile fails the read below.
+        ser = self._serial
+        if ser is None or not ser.is_open:
             return b""
         try:
-            return ser.read(self._READ_CHUNK_SIZE)
-        except SerialException as exc:
+            waiting = ser.in_waiting
+            return ser.read(min(waiting, self._READ_CHUNK_SIZE) if waiting else 1)
+        except (SerialException, OSError) as exc:
             self._set_error(f"serial read error: {exc}")
             self._close_serial()
             return b""
@@ -261,16 +315,15 @@ class MboxConnectionWorker(BaseConnectionWorker):
         """
         Read total count from external counter, if enabled.
         """
-        cfg = self._mbox_cfg
-        if not getattr(cfg, "ext_counter", False):
+        if not self._ext_counter_enabled:
             return None
         if self._counter_total_provider is None:
             return None
-        counter_conn_id = getattr(cfg, "counter_connection_id", None)
-        device_id = getattr(cfg, "counter_device_id", None)
+        counter_conn_id = self._counter_conn_id
+        device_id = self._counter_device_id
         if counter_conn_id is None or device_id is None:
             return None
-        return self._counter_total_provider(int(counter_conn_id), int(device_id))
+        return self._counter_total_provider(counter_conn_id, device_id)
 
     def _tick_counter_logic(self, now: float) -> None:
         """
@@ -303,8 +356,7 @@ class MboxConnectionWorker(BaseConnectionWorker):
 
         # Counter increment without pack -> schedule miss insert
         self._pending_miss += int(delta)
-        miss_timeout = float(getattr(self._mbox_cfg, "counter_miss_timeout", 4.0))
-        self._miss_deadline_ts = now + miss_timeout
+        self._miss_deadline_ts = now + self._miss_timeout
 
     def _tick_miss_insert(self, now: float) -> None:
         """
@@ -319,8 +371,7 @@ class MboxConnectionWorker(BaseConnectionWorker):
         if self._pending_miss <= 0:
             return
 
-        limit = int(getattr(self._mbox_cfg, "miss_insert_limit", 1))
-        n = min(self._pending_miss, max(limit, 1))
+        n = min(self._pending_miss, self._miss_limit)
         self._pending_miss -= n
 
         for _ in range(n):
@@ -348,38 +399,14 @@ class MboxConnectionWorker(BaseConnectionWorker):
             base = self._last_good_vars
 
         if base is None:
-            base = dict(cfg.miss_default or {})
+            base = cfg.miss_default or {}
 
-        vars_ = dict(base)
-        vars_["mbox_id"] = cfg.mbox_id
-        vars_["tare"] = cfg.tare
-        vars_["lot"] = cfg.lot
-        vars_["on_error"] = True
-        vars_["error_info"] = cfg.miss_error_label
-        vars_["created_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        # One merge into a new dict; base itself is never modified
+        vars_ = {**base, **self._miss_fixed_vars, "created_at": now_str(_SQL_TIMESTAMP_FORMAT)}
 
         sql, params = build_query(self._config.query_template, vars_)
         self._log_message(f"MBox write to DB: {sql} {params}")
-
-        def do_write():
-            self._db_writer.write(sql, params)
-
-        try:
-            self._metric_time_block(
-                "db_write_latency_ms_last",
-                "db_write_latency_ms_avg",
-                do_write,
-                extra=False,
-            )
-            self._log_message(f"mbox miss pack inserted ({cfg.miss_strategy})")
-            self._metric_set("last_db_write_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
-            self._metric_inc("db_writes_total")
-            self._metric_inc("packs_total", extra=True)
-            self._metric_inc("packs_miss_total", extra=True)
-        except Exception as exc:
-            self._metric_set("last_db_error_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
-            self._metric_inc("db_write_fail_total")
-            self._set_error(f"db miss write error: {exc}")
+        self._enqueue_write((sql, params, None))
 
     # ---------------- mbox commands ----------------
 
@@ -411,15 +438,20 @@ class MboxConnectionWorker(BaseConnectionWorker):
         """
         try:
             autoconnect = self._mbox_cfg.port.autoconnect
-            encoding = self._mbox_cfg.encoding
+            mbox_id = self._mbox_cfg.mbox_id
+            ext_counter = self._ext_counter_enabled
+            self._start_db_thread()
 
             while not self._stop_event.is_set():
-                now = time.time()
-                self._tick_counter_logic(now)
-                self._tick_miss_insert(now)
+                # Miss deadlines are only ever set by the counter logic, so
+                # without an external counter both ticks are skipped
+                if ext_counter:
+                    now = time.time()
+                    self._tick_counter_logic(now)
+                    self._tick_miss_insert(now)
 
-                with self._serial_lock:
-                    opened = self._serial is not None and self._serial.is_open
+                ser = self._serial
+                opened = ser is not None and ser.is_open
 
                 if not opened:
                     if not self._open_serial():
@@ -432,7 +464,8 @@ class MboxConnectionWorker(BaseConnectionWorker):
 
                 data = self._read_serial()
                 if not data:
-                    time.sleep(0.01)
+                    if self._stop_event.wait(self._IDLE_WAIT):
+                        break
                     continue
 
                 frames = self._framer.feed(data)
@@ -441,13 +474,10 @@ class MboxConnectionWorker(BaseConnectionWorker):
                 for payload in frames:
                     self._metric_inc("frames_total", extra=True)
                     try:
-                        rec = parse_label_frame(payload, encoding=encoding)
-                        # print(f"Parse: {rec}")
-                        self._metric_inc("parse_ok_total", extra=True)
-                        result = self._transformer.transform(mbox_id=self._mbox_cfg.mbox_id, rec=rec)
+                        result = self._transformer.parse_and_transform(mbox_id, payload)
                         # print(f"Transform: {result}")
-                        clean_timeout = float(getattr(self._mbox_cfg, "counter_clean_timeout", 6.0))
-                        self._pending_pack_ts = time.time() + clean_timeout
+                        self._metric_inc("parse_ok_total", extra=True)
+                        self._pending_pack_ts = time.time() + self._clean_timeout
                         self._handle_result(result)
                     except Exception as exc:
                         # print("parse/transform error")
@@ -460,7 +490,8 @@ class MboxConnectionWorker(BaseConnectionWorker):
             self._set_error(str(exc))
             self._set_state(WorkerState.ERROR)
         finally:
-            self._metric_set("stopped_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._stop_db_thread()
+            self._metric_set("stopped_at", now_str())
             self.close()
             if self.state not in (WorkerState.STOPPED, WorkerState.ERROR):
                 self._set_state(WorkerState.STOPPED)
@@ -478,23 +509,178 @@ class MboxConnectionWorker(BaseConnectionWorker):
 
         sql, params = build_query(self._config.query_template, result.variables)
         self._log_message(f"DB write: {params}")
+        self._enqueue_write((sql, params, result.variables))
 
-        def do_write():
-            self._db_writer.write(sql, params)
+    def _enqueue_write(self, item: _DbItem) -> None:
+        """
+        Hands a DB write to the writer thread.
 
+        If the queue stays full for _DB_PUT_TIMEOUT, the row is dropped and
+        counted, so rows are only ever written by the writer thread and in
+        order. Without a writer thread (e.g. called outside the run loop)
+        the row is written synchronously.
+        """
+        if self._db_thread is None:
+            self._write_rows([item])
+            return
         try:
-            self._metric_time_block(
-                "db_write_latency_ms_last",
-                "db_write_latency_ms_avg",
-                do_write,
-                extra=False,
-            )
-            self._last_good_vars = dict(result.variables)
-            self._metric_set("last_db_write_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
-            self._metric_inc("db_writes_total")
-            self._metric_inc("packs_total", extra=True)
-            self._metric_inc("packs_clean_total", extra=True)
+            self._db_queue.put(item, timeout=self._DB_PUT_TIMEOUT)
+        except queue.Full:
+            self._drop_rows(1, "db write queue full")
+
+    def _drop_rows(self, count: int, reason: str) -> None:
+        self._metric_inc("db_rows_dropped_total", count, extra=True)
+        self._set_error(f"{reason}: {count} row(s) dropped")
+
+    def _start_db_thread(self) -> None:
+        if self._db_writer is None:
+            return
+        # Fresh queue per run: a writer thread left over from a previous run
+        # (stuck in a DB call past its stop timeout) keeps its own queue
+        q: "queue.Queue[Optional[_DbItem]]" = queue.Queue(maxsize=self._DB_QUEUE_SIZE)
+        thread = threading.Thread(target=self._db_loop, args=(q,), daemon=True)
+        with self._db_thread_lock:
+            self._db_queue = q
+            self._db_thread = thread
+            self._db_drain_deadline = None
+            self._db_close_pending = False
+        thread.start()
+
+    def _stop_db_thread(self) -> None:
+        """
+        Lets the writer thread drain the queue for up to _DB_DRAIN_TIMEOUT
+        and waits for it to exit. Rows still queued at the deadline are
+        dropped (db_rows_dropped_total).
+        """
+        thread = self._db_thread
+        if thread is None:
+            return
+        deadline = time.monotonic() + self._DB_DRAIN_TIMEOUT
+        self._db_drain_deadline = deadline
+        try:
+            self._db_queue.put(None, timeout=self._DB_DRAIN_TIMEOUT)
+        except queue.Full:
+            # The writer drops the queued rows once it sees the deadline
+            pass
+        thread.join(max(deadline - time.monotonic(), 0.0))
+        if thread.is_alive():
+            self._set_error("db writer thread did not stop in time")
+
+    def _db_loop(self, q: "queue.Queue[Optional[_DbItem]]") -> None:
+        """
+        Writer thread: waits for a queued row, then also takes whatever else
+        is already queued (up to _DB_BATCH_MAX_ROWS) and writes it with one
+        executemany per run of rows with the same SQL.
+
+        Batches grow only while writes lag behind the serial loop, so a
+        lone row is written without extra delay. Exits on the None sentinel
+        after writing everything queued before it; once the drain deadline
+        set by _stop_db_thread has passed (or a newer run has replaced this
+        thread), the rows still queued are dropped instead.
+        """
+        me = threading.current_thread()
+        try:
+            running = True
+            while running:
+                if self._db_thread is not me or self._drain_expired():
+                    self._drop_queued_rows(q)
+                    return
+
+                item = q.get()
+                if item is None:
+                    break
+                batch: List[_DbItem] = [item]
+                while len(batch) < self._DB_BATCH_MAX_ROWS:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        running = False
+                        break
+                    batch.append(item)
+
+                start = 0
+                for i in range(1, len(batch) + 1):
+                    if i == len(batch) or batch[i][0] != batch[start][0]:
+                        if self._drain_expired():
+                            self._drop_rows(len(batch) - start, "db writer stopped before draining")
+                            self._drop_queued_rows(q)
+                            return
+                        self._write_rows(batch[start:i])
+                        start = i
+        finally:
+            with self._db_thread_lock:
+                current = self._db_thread is me
+                if current:
+                    self._db_thread = None
+                close_writer = current and self._db_close_pending
+            if close_writer:
+                self._db_writer.close()
+
+    def _drain_expired(self) -> bool:
+        deadline = self._db_drain_deadline
+        return deadline is not None and time.monotonic() >= deadline
+
+    def _drop_queued_rows(self, q: "queue.Queue[Optional[_DbItem]]") -> None:
+        """
+        Empties a writer queue without writing, counting the dropped rows.
+        """
+        dropped = 0
+        while True:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                dropped += 1
+        if dropped:
+            self._drop_rows(dropped, "db writer stopped before draining")
+
+    def _write_rows(self, items: List[_DbItem]) -> None:
+        """
+        Writes rows sharing one SQL in one DB call and updates DB metrics.
+
+        If a batch fails, its rows are retried one by one, so a single bad
+        row does not drop the others and each failure is reported. A lost
+        connection fails every row alike, so then the batch is not retried
+        and all of its rows are counted as failed.
+        """
+        sql = items[0][0]
+        try:
+            with self._timed("db_write_latency_ms_last", "db_write_latency_ms_avg"):
+                if len(items) == 1:
+                    self._db_writer.write(sql, items[0][1])
+                else:
+                    self._db_writer.write_many(sql, [params for _, params, _ in items])
         except Exception as exc:
-            self._metric_set("last_db_error_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
-            self._metric_inc("db_write_fail_total")
-            self._set_error(f"db write error: {exc}")
+            if len(items) > 1 and not is_connection_error(exc):
+                for n, item in enumerate(items):
+                    if self._drain_expired():
+                        self._drop_rows(len(items) - n, "db writer stopped before draining")
+                        return
+                    self._write_rows([item])
+                return
+            self._metric_set("last_db_error_at", now_str())
+            self._metric_inc("db_write_fail_total", len(items))
+            if len(items) > 1:
+                self._set_error(f"db write error ({len(items)} rows): {exc}")
+            elif items[0][2] is None:
+                self._set_error(f"db miss write error: {exc}")
+            else:
+                self._set_error(f"db write error: {exc}")
+            return
+
+        self._metric_set("last_db_write_at", now_str())
+        self._metric_inc("db_writes_total", len(items))
+        self._metric_inc("packs_total", len(items), extra=True)
+        for _, _, variables in items:
+            if variables is None:
+                self._log_message(f"mbox miss pack inserted ({self._mbox_cfg.miss_strategy})")
+                self._metric_inc("packs_miss_total", extra=True)
+            else:
+                # Only rows actually written become the "last good" values.
+                # Built fresh for each result and never modified afterwards
+                # (_insert_miss_pack merges it into a new dict), so no copy
+                self._last_good_vars = variables
+                self._metric_inc("packs_clean_total", extra=True)
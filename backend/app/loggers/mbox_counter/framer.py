@@ -24,6 +24,9 @@ from typing import List
 
 PREAMBLE = 0x27
 
+# Consumed bytes are dropped from the buffer once there are this many
+_COMPACT_THRESHOLD = 4096
+
 
 class MboxCounterFramer:
     """
@@ -38,10 +41,15 @@ class MboxCounterFramer:
     Notes:
     - The framer does not validate CRC/checksum here; it only cuts frames.
     - Returned frames include the preamble byte and length byte.
+    - Consumed bytes are skipped with a read offset (_head) and only
+      removed from the buffer once they pile up, so already examined
+      bytes are never rescanned or memmoved per frame.
     """
     def __init__(self) -> None:
         # Internal rolling buffer with unprocessed bytes
         self._buf = bytearray()
+        # Offset of the first unprocessed byte in _buf
+        self._head = 0
 
     def feed(self, data: bytes) -> List[bytes]:
         """
@@ -54,38 +62,48 @@ class MboxCounterFramer:
         if not data:
             return frames
 
-        self._buf.extend(data)
-
-        while True:
-            # Search for preamble byte to synchronize on frame start
-            try:
-                stx = self._buf.index(PREAMBLE)
-            except ValueError:
-                # No preamble found -> buffer is garbage, clear it to avoid growth
-                self._buf.clear()
-                return frames
-
-            # Drop any leading garbage bytes before the preamble
-            if stx > 0:
-                del self._buf[:stx]
-
-            # Need at least PREAMBLE + LEN
-            if len(self._buf) < 2:
-                return frames
-
-            # Length byte determines expected frame size
-            L = self._buf[1]
-            frame_len = 4 + L
-            if frame_len <= 0:
-                # Defensive guard against corrupted stream: discard one byte and resync
-                del self._buf[:1]
-                continue
-
-            # Not enough bytes yet -> wait for next feed()
-            if len(self._buf) < frame_len:
-                return frames
-
-            # Extract full frame and remove it from the buffer
-            frame = bytes(self._buf[:frame_len])
-            frames.append(frame)
-            del self._buf[:frame_len]
+        buf = self._buf
+        buf.extend(data)
+        find = buf.find
+        head = self._head
+
+        # Frames are copied once, straight from a view of the buffer
+        # (slicing the bytearray first would copy them twice)
+        with memoryview(buf) as view:
+            while True:
+                # Search for preamble byte to synchronize on frame start
+                stx = find(PREAMBLE, head)
+                if stx == -1:
+                    # No preamble found -> buffer is garbage, drop all of it
+                    head = len(buf)
+                    break
+
+                # Skip any leading garbage bytes before the preamble
+                head = stx
+
+                # Need at least PREAMBLE + LEN
+                if len(buf) - head < 2:
+                    break
+
+                # Length byte determines expected frame size
+                L = buf[head + 1]
+                frame_len = 4 + L
+                if frame_len <= 0:
+                    # Defensive guard against corrupted stream: discard one byte and resync
+                    head += 1
+                    continue
+
+                # Not enough bytes yet -> wait for next feed()
+                if len(buf) - head < frame_len:
+                    break
+
+                # Extract full frame and mark it as processed
+                frames.append(bytes(view[head:head + frame_len]))
+                head += frame_len
+
+        # Drop the processed prefix once it is large (or most of the buffer)
+        if head and (head > _COMPACT_THRESHOLD or head > len(buf) // 2):
+            del buf[:head]
+            head = 0
+        self._head = head
+        return frames
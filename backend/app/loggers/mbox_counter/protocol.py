@@ -14,6 +14,7 @@ Responsibilities:
 - It does NOT deal with serial I/O or buffering (handled by the framer).
 """
 
+import struct
 from dataclasses import dataclass
 
 
@@ -26,6 +27,25 @@ C_READ_RESP = 0x08  # CODE8: counters data response
 # Address of the "pass-through" counter
 DATA_ADDR = b"\x01\x00"
 
+# Little-endian field layouts
+_SERIAL = struct.Struct("<H")       # A: device serial
+_RESP_DATA = struct.Struct("<IHB")  # read response DATA: total, size_dir, flags
+
+
+def _crc8_e5_byte(crc: int) -> int:
+    """
+    Run the 8 shift/xor rounds of crc8_e5 for one (already xor-ed) byte.
+    """
+    for _ in range(8):
+        if crc & 0x80:
+            crc ^= 0xE5
+        crc = (crc << 1) & 0xFF
+    return crc
+
+
+# _CRC8_E5_TABLE[x] == 8 rounds applied to x
+_CRC8_E5_TABLE = bytes(_crc8_e5_byte(i) for i in range(256))
+
 
 def crc8_e5(data: bytes) -> int:
     """
@@ -40,19 +60,26 @@ def crc8_e5(data: bytes) -> int:
               crc <<= 1
       - result = bitwise NOT of crc
 
+    The 8 inner rounds are precomputed in _CRC8_E5_TABLE,
+    so each byte costs a single table lookup.
+
     :param data: Input byte sequence
     :return: CRC8 value (0..255)
     """
+    table = _CRC8_E5_TABLE
     crc = 0
     for b in data:
-        crc ^= b
-        for _ in range(8):
-            if crc & 0x80:
-                crc ^= 0xE5
-            crc = (crc << 1) & 0xFF
+        crc = table[crc ^ b]
     return (~crc) & 0xFF
 
 
+# Constant parts of a read request: L, the CRC state after [L, C],
+# and the DATA block with its CRC
+_REQ_LEN = 5
+_REQ_HDR_CRC_STATE = _CRC8_E5_TABLE[_CRC8_E5_TABLE[_REQ_LEN] ^ C_READ_REQ]
+_REQ_DATA_BLOCK = DATA_ADDR + bytes((crc8_e5(DATA_ADDR),))
+
+
 def build_read_request(serial_u16: int) -> bytes:
     """
     Build a binary request frame for reading counter values.
@@ -75,12 +102,12 @@ def build_read_request(serial_u16: int) -> bytes:
     if not (0 <= serial_u16 <= 0xFFFF):
         raise ValueError("serial must be uint16 (0..65535)")
 
-    a = serial_u16.to_bytes(2, "little")
-    L = 5
-    header = bytes([L, C_READ_REQ]) + a
-    hdr_crc = crc8_e5(header).to_bytes(1, "little")
-    data_crc = crc8_e5(DATA_ADDR).to_bytes(1, "little")
-    return bytes([PREAMBLE]) + header + hdr_crc + DATA_ADDR + data_crc
+    a0 = serial_u16 & 0xFF
+    a1 = serial_u16 >> 8
+    table = _CRC8_E5_TABLE
+    # Continue the header CRC from the precomputed [L, C] state
+    hdr_crc = ~table[table[_REQ_HDR_CRC_STATE ^ a0] ^ a1] & 0xFF
+    return bytes((PREAMBLE, _REQ_LEN, C_READ_REQ, a0, a1, hdr_crc)) + _REQ_DATA_BLOCK
 
 
 @dataclass(frozen=True)
@@ -136,8 +163,7 @@ def parse_response_frame(frame: bytes) -> ParsedCountersResponse:
         raise ValueError(f"unexpected control code: 0x{C:02x}")
 
     # Device serial number
-    a_bytes = frame[3:5]
-    serial_u16 = int.from_bytes(a_bytes, "little")
+    (serial_u16,) = _SERIAL.unpack_from(frame, 3)
 
     # Header CRC check
     hdr_crc = frame[5]
@@ -157,9 +183,7 @@ def parse_response_frame(frame: bytes) -> ParsedCountersResponse:
     if len(data) != 7:
         raise ValueError(f"unexpected data length: {len(data)} (expected 7)")
 
-    total = int.from_bytes(data[0:4], "little", signed=False)
-    size_dir = int.from_bytes(data[4:6], "little", signed=False)
-    flags = data[6]
+    total, size_dir, flags = _RESP_DATA.unpack_from(data)
 
     return ParsedCountersResponse(
         serial=serial_u16,
@@ -26,12 +26,11 @@ Design notes:
 import threading
 import time
 from typing import Optional, Dict
-from datetime import datetime
 
 import serial
 from serial import Serial, SerialException
 
-from backend.app.loggers.base import BaseConnectionWorker, WorkerState
+from backend.app.loggers.base import BaseConnectionWorker, WorkerState, now_str
 from backend.app.loggers.models import LoggerConnectionConfig, ConnectionType
 from backend.app.loggers.mbox_counter.config import MboxCounterConfig, MboxCounterDeviceConfig
 from backend.app.loggers.mbox_counter.framer import MboxCounterFramer
@@ -118,7 +117,7 @@ class MboxCounterConnectionWorker(BaseConnectionWorker):
             self._set_state(WorkerState.RUNNING)
 
             self._metric_inc("runs_total")
-            self._metric_set("started_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._metric_set("started_at", now_str())
 
             self._thread.start()
 
@@ -187,9 +186,10 @@ class MboxCounterConnectionWorker(BaseConnectionWorker):
                 pass
 
     def _read_serial(self) -> bytes:
-        with self._serial_lock:
-            ser = self._serial
-        if not ser or not ser.is_open:
+        # A plain attribute read is atomic; the lock only serializes
+        # opening/closing. A port closed meanwhile fails the read below.
+        ser = self._serial
+        if ser is None or not ser.is_open:
             return b""
         try:
             return ser.read(self._READ_CHUNK_SIZE)
@@ -199,8 +199,7 @@ class MboxCounterConnectionWorker(BaseConnectionWorker):
             return b""
 
     def _write_serial(self, data: bytes) -> None:
-        with self._serial_lock:
-            ser = self._serial
+        ser = self._serial
         if not ser or not ser.is_open:
             raise RuntimeError("serial is not open")
         ser.write(data)
@@ -214,8 +213,8 @@ class MboxCounterConnectionWorker(BaseConnectionWorker):
             poll_interval = self._cfg.poll_interval if self._cfg.poll_interval > 0 else 0.2
 
             while not self._stop_event.is_set():
-                with self._serial_lock:
-                    opened = self._serial is not None and self._serial.is_open
+                ser = self._serial
+                opened = ser is not None and ser.is_open
 
                 if not opened:
                     if not self._open_serial():
@@ -227,12 +226,8 @@ class MboxCounterConnectionWorker(BaseConnectionWorker):
                         continue
 
                 # Measure end-to-end time of one poll iteration
-                self._metric_time_block(
-                    "poll_latency_ms_last",
-                    "poll_latency_ms_avg",
-                    self._poll_once,
-                    extra=True,
-                )
+                with self._timed("poll_latency_ms_last", "poll_latency_ms_avg", extra=True):
+                    self._poll_once()
 
                 # Sleep until next poll tick (interruptible by stop event)
                 if self._stop_event.wait(poll_interval):
@@ -244,7 +239,7 @@ class MboxCounterConnectionWorker(BaseConnectionWorker):
             self._set_error(str(exc))
             self._set_state(WorkerState.ERROR)
         finally:
-            self._metric_set("stopped_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._metric_set("stopped_at", now_str())
             self.close()
             if self.state not in (WorkerState.STOPPED, WorkerState.ERROR):
                 self._set_state(WorkerState.STOPPED)
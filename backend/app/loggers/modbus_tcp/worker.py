@@ -35,11 +35,10 @@ import threading
 import time
 from typing import Optional, Dict, List, Protocol, runtime_checkable, Union, Any
 from struct import pack, unpack
-from datetime import datetime
 
 from pymodbus.client import ModbusTcpClient
 
-from backend.app.loggers.base import BaseConnectionWorker, WorkerState
+from backend.app.loggers.base import BaseConnectionWorker, WorkerState, now_str
 from backend.app.loggers.models import LoggerConnectionConfig, ConnectionType
 from backend.app.loggers.modbus_tcp.config import (
     ModbusTcpConfig,
@@ -152,7 +151,7 @@ class ModbusTcpConnectionWorker(BaseConnectionWorker):
             self._set_state(WorkerState.RUNNING)
 
             self._metric_inc("runs_total")
-            self._metric_set("started_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._metric_set("started_at", now_str())
 
             self._thread.start()
 
@@ -258,15 +257,8 @@ class ModbusTcpConnectionWorker(BaseConnectionWorker):
                 try:
                     self._metric_inc("polls_total", extra=True)
 
-                    def do_poll():
+                    with self._timed("poll_latency_ms_last", "poll_latency_ms_avg", extra=True):
                         self._poll_once()
-
-                    self._metric_time_block(
-                        "poll_latency_ms_last",
-                        "poll_latency_ms_avg",
-                        do_poll,
-                        extra=True,
-                    )
                 except Exception as exc:
                     self._set_error(f"poll error: {exc}")
 
@@ -278,7 +270,7 @@ class ModbusTcpConnectionWorker(BaseConnectionWorker):
             self._set_error(str(exc))
             self._set_state(WorkerState.ERROR)
         finally:
-            self._metric_set("stopped_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._metric_set("stopped_at", now_str())
             self.close()
             if self.state not in (WorkerState.STOPPED, WorkerState.ERROR):
                 self._set_state(WorkerState.STOPPED)
@@ -343,20 +335,13 @@ class ModbusTcpConnectionWorker(BaseConnectionWorker):
 
         self._metric_inc("requests_total", extra=True)
 
-        def do_req():
-            return client.read_holding_registers(
+        with self._timed("request_latency_ms_last", "request_latency_ms_avg", extra=True):
+            response = client.read_holding_registers(
                 address=var.address,
                 count=count,
                 device_id=slave_id,
             )
 
-        response = self._metric_time_block(
-            "request_latency_ms_last",
-            "request_latency_ms_avg",
-            do_req,
-            extra=True,
-        )
-
         # `pymodbus`-style response: has isError() and .registers
         if response is None or getattr(response, "isError", lambda: True)():
             raise RuntimeError("modbus response error")
@@ -481,19 +466,12 @@ class ModbusTcpConnectionWorker(BaseConnectionWorker):
         sql, params = build_query(self._config.query_template, payload)
         self._log_message(f"DB write: {params}")
 
-        def do_write():
-            self._db_writer.write(sql, params)
-
         try:
-            self._metric_time_block(
-                "db_write_latency_ms_last",
-                "db_write_latency_ms_avg",
-                do_write,
-                extra=False,
-            )
-            self._metric_set("last_db_write_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            with self._timed("db_write_latency_ms_last", "db_write_latency_ms_avg"):
+                self._db_writer.write(sql, params)
+            self._metric_set("last_db_write_at", now_str())
             self._metric_inc("db_writes_total")
         except Exception as exc:
-            self._metric_set("last_db_error_at", datetime.now().strftime("%d-%m-%Y %H:%M:%S"))
+            self._metric_set("last_db_error_at", now_str())
             self._metric_inc("db_write_fail_total")
             self._set_error(f"db write error: {exc}")
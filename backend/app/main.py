@@ -42,7 +42,7 @@ from contextlib import asynccontextmanager
 from starlette.responses import FileResponse, JSONResponse
 
 from backend.app.api.routers import api_router
-from backend.app.api.deps import get_runtime_manager
+from backend.app.api.deps import init_managers
 
 
 origins = [
@@ -99,7 +99,7 @@ def build_dir() -> Path:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    runtime_manager = get_runtime_manager()
+    runtime_manager = init_managers()
     yield
     runtime_manager.shutdown_all(timeout=5.0)
 
@@ -321,8 +321,7 @@ def main():
             
         # Clear cached managers before restart (required for clean restarts)    
         from backend.app.api import deps
-        deps.get_runtime_manager.cache_clear()
-        deps.get_settings_manager.cache_clear()
+        deps.reset_managers()
 
         # Start server in a background thread
         holder.clear()
@@ -17,7 +17,7 @@ The model is based on Pydantic, so it provides:
 - Easy loading from dict / JSON / YAML / env-backed sources (depending on how it is used).
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import List
 from backend.app.schemas.db_settings import DbSettings
 from backend.app.loggers.models import LoggerConnectionConfig
@@ -37,6 +37,11 @@ class AppSettings(BaseModel):
         connection (easy_serial, mbox, mbox_counter, modbus_rtu, modbus_tcp, etc.)
         and is interpreted by the corresponding ConnectionWorker.
 
+    - next_connection_id:
+        ID to give to the next created connection. It only grows, so IDs of
+        deleted connections are never reused. Files written before this field
+        existed get it derived from the largest stored ID.
+
     Typical usage:
     - Loaded once during application startup.
     - Passed to components responsible for initializing workers and services.
@@ -44,3 +49,24 @@ class AppSettings(BaseModel):
     """
     db: DbSettings = DbSettings()
     connections: List[LoggerConnectionConfig] = Field(default_factory=list)
+    next_connection_id: int = Field(default=1, ge=1)
+
+    @model_validator(mode="after")
+    def _bump_next_connection_id(self) -> "AppSettings":
+        """
+        Keeps next_connection_id above every stored ID (a missing field, or a
+        file edited by hand). Runs after validation, so IDs are already ints;
+        it only adjusts this freshly built instance.
+        """
+        max_id = max((c.id or 0 for c in self.connections), default=0)
+        if self.next_connection_id <= max_id:
+            self.next_connection_id = max_id + 1
+        return self
+
+    def allocate_connection_id(self) -> int:
+        """
+        Returns the next free connection ID and advances the counter.
+        """
+        new_id = self.next_connection_id
+        self.next_connection_id = new_id + 1
+        return new_id
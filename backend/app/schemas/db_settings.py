@@ -13,7 +13,7 @@ separate from lower-level DB client / engine implementations.
 
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DbActionType(str, Enum):
@@ -42,13 +42,24 @@ class DbSettings(BaseModel):
     These settings describe how the backend should connect to
     the main database. Credentials here are considered *global*
     defaults and may be overridden per-connection (per logger).
+
+    Pool fields are passed to SQLAlchemy's create_engine and default
+    to SQLAlchemy's own defaults (pool_recycle=-1 disables recycling).
+
+    The model is frozen (and therefore hashable), so derived values such
+    as the DSN can be cached per settings instance.
     """
+    model_config = ConfigDict(frozen=True)
+
     host: str = "127.0.0.1"
     port: int = 5432
     database: str = ""
     user: str = ""
     password: str = ""
     sslmode: str = "prefer"
+    pool_size: int = Field(default=5, ge=1)
+    max_overflow: int = Field(default=10, ge=0)
+    pool_recycle: int = -1
 
 
 class DbSettingsAction(BaseModel):
@@ -0,0 +1,75 @@
+# backend/tests/test_db_writer_shared_engine.py
+"""
+Unit tests for shared engine reference counting in SQLAlchemyDBWriter.
+
+No database is needed: SQLAlchemy engines connect lazily, and these tests
+only take and release engines without executing anything.
+
+Covered:
+- writers with the same settings share one engine, acquired on first use
+- the engine is disposed and unregistered when the last writer closes
+- a writer closed on worker stop re-acquires the shared engine when the
+  worker is started again (stop -> start -> close)
+"""
+
+from backend.app.core import db_writer
+from backend.app.core.db_writer import SQLAlchemyDBWriter
+from backend.app.schemas.db_settings import DbSettings
+
+
+def make_writer() -> SQLAlchemyDBWriter:
+    base = DbSettings(host="127.0.0.1", port=5432, database="engines_test")
+    return SQLAlchemyDBWriter(base, db_user="logger", db_password="secret")
+
+
+def test_engine_acquired_lazily_and_shared():
+    a = make_writer()
+    b = make_writer()
+    assert not db_writer._engines
+
+    assert a.engine is b.engine
+    assert list(db_writer._engine_refs.values()) == [2]
+
+    a.close()
+    b.close()
+    assert not db_writer._engines
+    assert not db_writer._engine_refs
+
+
+def test_stop_start_close_keeps_engine_shared():
+    a = make_writer()
+    b = make_writer()
+    first = a.engine
+    b.engine
+
+    # Worker stop closes the writer; close() twice must not over-release
+    a.close()
+    a.close()
+    assert list(db_writer._engine_refs.values()) == [1]
+
+    # Worker start again: the same writer takes the shared engine again
+    assert a.engine is first
+    assert list(db_writer._engine_refs.values()) == [2]
+
+    b.close()
+    c = make_writer()
+    assert c.engine is a.engine
+
+    a.close()
+    c.close()
+    assert not db_writer._engines
+    assert not db_writer._engine_refs
+
+
+def test_release_after_dispose_all_is_noop():
+    a = make_writer()
+    a.engine
+    db_writer.dispose_all_engines()
+
+    b = make_writer()
+    b.engine
+    a.close()
+    assert list(db_writer._engine_refs.values()) == [1]
+
+    b.close()
+    assert not db_writer._engines
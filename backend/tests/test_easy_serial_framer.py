@@ -76,3 +76,22 @@ def test_framer_partial_frames():
 
     frames3 = framer.feed(b"123\n")
     assert frames3 == [b"xyz123"]
+
+
+def test_framer_terminator_split_across_feeds():
+    """
+    A multi-byte terminator split between chunks must still be found,
+    even though already scanned bytes are not searched again.
+    """
+    framer = EasySerialFramer(preamble=r"\x02", terminator=r"\r\n")
+
+    assert framer.feed(b"\x02PAY") == []
+    assert framer.feed(b"LOAD\r") == []
+    assert framer.feed(b"\n\x02NEXT\r\n") == [b"PAYLOAD", b"NEXT"]
+
+    # byte-by-byte feeding gives the same frames
+    framer = EasySerialFramer(preamble=r"\x02", terminator=r"\r\n")
+    frames = []
+    for b in b"xx\x02AB\r\n\x02CD\r\n":
+        frames.extend(framer.feed(bytes([b])))
+    assert frames == [b"AB", b"CD"]
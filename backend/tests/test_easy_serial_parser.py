@@ -8,11 +8,14 @@ What this test covers:
 - Each extracted field is converted to the requested type:
   - string, int, float
   - datetime/date/time via `datetime.strptime()` using `field.format`
+    (ISO-8601 formats go through `datetime.fromisoformat()` with the same result)
 - Out-of-range indices must raise `IndexError` (configuration vs payload mismatch).
 
 These tests do not depend on serial ports, framing, or database logic.
 """
 
+from datetime import datetime
+
 from backend.app.loggers.easy_serial.config import (
     EasySerialParserSettings,
     EasySerialParsedFieldConfig
@@ -79,3 +82,45 @@ def test_parser_datetime_field():
     assert dt.day == 19
     assert dt.hour == 15
     assert dt.minute == 30
+
+
+def test_parser_iso_datetime_matches_strptime():
+    """
+    ISO-8601 formats take the fromisoformat() fast path, but must accept
+    the same inputs as strptime(), including non-zero-padded values.
+    """
+    settings = EasySerialParserSettings(
+        separator=";",
+        fields=[
+            EasySerialParsedFieldConfig(
+                index=0, name="dt", type="datetime", format="%Y-%m-%d %H:%M:%S"
+            ),
+            EasySerialParsedFieldConfig(
+                index=1, name="d", type="date", format="%Y-%m-%d"
+            ),
+        ]
+    )
+
+    parsed = parse_payload_text("2025-11-19 15:30:05;2025-1-9", settings)
+
+    assert parsed["dt"] == datetime(2025, 11, 19, 15, 30, 5)
+    assert parsed["d"] == datetime(2025, 1, 9)
+
+    try:
+        parse_payload_text("2025-11-19T15:30:05;2025-01-09", settings)
+        assert False, "Expected ValueError for a value not matching the format"
+    except ValueError:
+        pass
+
+
+def test_parser_plan_cache_does_not_affect_settings():
+    """Parsing must not change settings equality, and new fields take effect."""
+    fields = [EasySerialParsedFieldConfig(index=0, name="a", type="int")]
+    used = EasySerialParserSettings(fields=fields)
+    fresh = EasySerialParserSettings(fields=list(fields))
+
+    assert parse_payload_text("1;2", used) == {"a": 1}
+    assert used == fresh
+
+    used.fields = [EasySerialParsedFieldConfig(index=1, name="b", type="int")]
+    assert parse_payload_text("1;2", used) == {"b": 2}
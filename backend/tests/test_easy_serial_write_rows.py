@@ -0,0 +1,101 @@
+# backend/tests/test_easy_serial_write_rows.py
+"""
+Unit tests for batched DB writes in EasySerialConnectionWorker.
+
+No serial port or database is needed: `_write_rows()` is called directly
+with a fake DB writer.
+
+Covered:
+- a batch failing because of one bad row is retried row by row, so the
+  other rows are still written
+- a batch failing because the connection is lost is failed once as a
+  whole, without a DB call per row
+"""
+
+from typing import Any, Dict, List
+
+from sqlalchemy.exc import OperationalError
+
+from backend.app.core.db_writer import BaseDBWriter
+from backend.app.loggers.models import LoggerConnectionConfig, ConnectionType
+from backend.app.loggers.easy_serial.config import (
+    EasySerialConfig,
+    EasySerialPortSettings,
+    EasySerialParserSettings,
+)
+from backend.app.loggers.easy_serial.worker import EasySerialConnectionWorker
+
+
+SQL = "INSERT INTO t (v) VALUES (:v)"
+
+
+class BadRowWriter(BaseDBWriter):
+    """Rejects any batch containing v == "bad", like a constraint violation."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.written: List[Dict[str, Any]] = []
+
+    def write(self, sql, params):
+        self.write_many(sql, [params])
+
+    def write_many(self, sql, params_list):
+        self.calls += 1
+        if any(p["v"] == "bad" for p in params_list):
+            raise ValueError("bad row")
+        self.written.extend(params_list)
+
+
+class DownWriter(BaseDBWriter):
+    """Fails every call the way SQLAlchemy does when the server is down."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def write(self, sql, params):
+        self.write_many(sql, [params])
+
+    def write_many(self, sql, params_list):
+        self.calls += 1
+        raise OperationalError(sql, {}, Exception("connection refused"))
+
+
+def make_worker(db_writer: BaseDBWriter) -> EasySerialConnectionWorker:
+    config = LoggerConnectionConfig(
+        id=1,
+        name="es_write_rows",
+        type=ConnectionType.easy_serial,
+        enabled=True,
+        query_template="INSERT INTO t (v) VALUES ({v})",
+        easy_serial=EasySerialConfig(
+            port=EasySerialPortSettings(port="COM_TEST"),
+            parser=EasySerialParserSettings(fields=[]),
+        ),
+    )
+    return EasySerialConnectionWorker(config, db_writer=db_writer)
+
+
+def test_bad_row_is_isolated():
+    writer = BadRowWriter()
+    worker = make_worker(writer)
+
+    worker._write_rows(SQL, [{"v": "a"}, {"v": "bad"}, {"v": "b"}])
+
+    # One failed batch call, then one call per row
+    assert writer.calls == 4
+    assert writer.written == [{"v": "a"}, {"v": "b"}]
+    metrics = worker.get_metrics()["metrics"]
+    assert metrics["db_writes_total"] == 2
+    assert metrics["db_write_fail_total"] == 1
+
+
+def test_connection_error_fails_batch_once():
+    writer = DownWriter()
+    worker = make_worker(writer)
+
+    worker._write_rows(SQL, [{"v": str(i)} for i in range(64)])
+
+    assert writer.calls == 1
+    metrics = worker.get_metrics()["metrics"]
+    assert metrics["db_writes_total"] == 0
+    assert metrics["db_write_fail_total"] == 64
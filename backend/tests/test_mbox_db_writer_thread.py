@@ -0,0 +1,134 @@
+# backend/tests/test_mbox_db_writer_thread.py
+"""
+Unit tests for the DB writer thread of MboxConnectionWorker.
+
+No serial port or database is needed: rows are handed to the writer thread
+with `_enqueue_write()` and a fake DB writer records or blocks the writes.
+Queue size and timeouts are shrunk on a test subclass to keep tests fast.
+
+Covered:
+- a row that finds the queue full for _DB_PUT_TIMEOUT is dropped and
+  counted; the queued rows are still written once, in order
+- stopping gives the writer _DB_DRAIN_TIMEOUT to drain; rows left after
+  that are dropped and counted instead of blocking the stop
+- `_last_good_vars` only follows rows that were actually written
+"""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+from backend.app.core.db_writer import BaseDBWriter
+from backend.app.loggers.models import LoggerConnectionConfig, ConnectionType
+from backend.app.loggers.mbox.config import MboxConfig
+from backend.app.loggers.mbox.worker import MboxConnectionWorker
+
+
+SQL = "INSERT INTO t (sn) VALUES (:sn)"
+SQL_MISS = "INSERT INTO t (sn, on_error) VALUES (:sn, TRUE)"
+
+
+class FastMboxWorker(MboxConnectionWorker):
+    _DB_QUEUE_SIZE = 2
+    _DB_PUT_TIMEOUT = 0.05
+    _DB_DRAIN_TIMEOUT = 0.2
+
+
+class RecordingWriter(BaseDBWriter):
+    """Records written rows; optionally sleeps or blocks until released."""
+
+    def __init__(self, delay: float = 0.0, block: bool = False) -> None:
+        self.rows: List[Dict[str, Any]] = []
+        self.delay = delay
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def write(self, sql, params):
+        self.write_many(sql, [params])
+
+    def write_many(self, sql, params_list):
+        self.entered.set()
+        self.release.wait()
+        time.sleep(self.delay)
+        self.rows.extend(params_list)
+
+
+class FailingWriter(BaseDBWriter):
+    def write(self, sql, params):
+        raise ValueError("rejected")
+
+
+def make_worker(db_writer: BaseDBWriter) -> FastMboxWorker:
+    config = LoggerConnectionConfig(
+        id=1,
+        name="mbox_writer_thread",
+        type=ConnectionType.mbox,
+        enabled=True,
+        query_template="INSERT INTO t (sn) VALUES ({sn})",
+        mbox=MboxConfig(mbox_id=1, port={"port": "FAKE", "autoconnect": False}),
+    )
+    return FastMboxWorker(config, db_writer=db_writer)
+
+
+def row(i: int, sql: str = SQL):
+    return sql, {"sn": i}, {"sn": i}
+
+
+def test_full_queue_drops_row_and_keeps_order():
+    writer = RecordingWriter(block=True)
+    w = make_worker(writer)
+    w._start_db_thread()
+
+    w._enqueue_write(row(0))
+    assert writer.entered.wait(1.0)   # row 0 is being written
+
+    w._enqueue_write(row(1))
+    w._enqueue_write(row(2))          # queue (size 2) is now full
+    w._enqueue_write(row(3))          # waits _DB_PUT_TIMEOUT, then dropped
+    assert w.get_metrics()["extra"]["db_rows_dropped_total"] == 1
+
+    writer.release.set()
+    w._stop_db_thread()
+
+    assert [r["sn"] for r in writer.rows] == [0, 1, 2]
+    assert w._db_thread is None
+    assert w._last_good_vars == {"sn": 2}
+
+
+def test_stop_drains_until_deadline_then_drops():
+    writer = RecordingWriter(delay=0.05)
+    w = make_worker(writer)
+    w._DB_QUEUE_SIZE = 100
+    w._start_db_thread()
+
+    # Alternating SQL splits every batch into single-row writes
+    for i in range(40):
+        w._enqueue_write(row(i, SQL_MISS if i % 2 else SQL))
+
+    t0 = time.monotonic()
+    w._stop_db_thread()
+    assert time.monotonic() - t0 < 1.0
+
+    # The writer exits right after its current write
+    deadline = time.monotonic() + 1.0
+    while w._db_thread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert w._db_thread is None
+
+    dropped = w.get_metrics()["extra"]["db_rows_dropped_total"]
+    assert 0 < len(writer.rows) < 40
+    assert len(writer.rows) + dropped == 40
+    assert [r["sn"] for r in writer.rows] == list(range(len(writer.rows)))
+
+
+def test_last_good_vars_only_follow_written_rows():
+    w = make_worker(FailingWriter())
+    w._write_rows([row(1)])
+    assert w._last_good_vars is None
+    assert w.get_metrics()["metrics"]["db_write_fail_total"] == 1
+
+    w._db_writer = RecordingWriter()
+    w._write_rows([row(2)])
+    assert w._last_good_vars == {"sn": 2}
@@ -48,7 +48,7 @@ class FakeSerial:
     """
     Minimal fake for pyserial.Serial.
 
-    The worker reads from this object via .read(size).
+    The worker reads from this object via .in_waiting / .read(size).
     We feed the worker by pre-filling an "inbox" bytearray.
     """
     def __init__(self, *args, **kwargs) -> None:
@@ -61,6 +61,10 @@ class FakeSerial:
         if inbox is not None:
             self._buf = inbox
 
+    @property
+    def in_waiting(self) -> int:
+        return len(self._buf)
+
     def read(self, size: int) -> bytes:
         if self._closed or not self.is_open:
             return b""
@@ -0,0 +1,38 @@
+# backend/tests/test_serial_ports.py
+"""
+Unit tests for the serial port availability probe.
+
+POSIX only: a pseudo-terminal stands in for a serial device.
+
+Covered:
+- a terminal device that can be opened is reported as free
+- paths that are not terminal devices (regular files, /dev/null) and
+  missing paths are not reported as free
+"""
+
+import os
+
+import pytest
+
+from backend.app.api.routers.serial_ports import _is_port_free
+
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="POSIX-only probe path")
+
+
+def test_pty_is_free():
+    master, slave = os.openpty()
+    try:
+        assert _is_port_free(os.ttyname(slave))
+    finally:
+        os.close(slave)
+        os.close(master)
+
+
+def test_non_tty_paths_are_not_free(tmp_path):
+    regular = tmp_path / "not_a_port"
+    regular.write_bytes(b"")
+
+    assert not _is_port_free(str(regular))
+    assert not _is_port_free(os.devnull)
+    assert not _is_port_free(str(tmp_path / "missing"))
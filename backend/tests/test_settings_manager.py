@@ -0,0 +1,154 @@
+# backend/tests/test_settings_manager.py
+"""
+Unit tests for SettingsManager (JSON settings file in a temporary directory).
+
+Covered:
+- bulk_upsert_connections() saves all connections with one file write
+- a duplicate name aborts the whole bulk upsert without touching the
+  file, the cached settings or the caller's objects
+- connections are handed out and stored as copies of the cached objects
+- the cache is re-read when the file changes on disk (size or mtime)
+- connection IDs are never reused after a delete, also across restarts,
+  and files written before next_connection_id existed still load
+"""
+
+import json
+import os
+
+import pytest
+
+from backend.app.core.settings_manager import (
+    ConnectionNameAlreadyExistsError,
+    SettingsManager,
+)
+from backend.app.loggers.models import LoggerConnectionConfig, ConnectionType
+from backend.app.schemas.app_settings import AppSettings
+
+
+def make_conn(name: str, conn_id=None) -> LoggerConnectionConfig:
+    return LoggerConnectionConfig(id=conn_id, name=name, type=ConnectionType.easy_serial)
+
+
+@pytest.fixture
+def manager(tmp_path) -> SettingsManager:
+    return SettingsManager(str(tmp_path / "settings.json"))
+
+
+def test_bulk_upsert_saves_all_with_one_write(manager, monkeypatch):
+    existing = manager.upsert_connection(make_conn("a"))
+
+    writes = []
+    original = type(manager._path).write_bytes
+    monkeypatch.setattr(
+        type(manager._path),
+        "write_bytes",
+        lambda path, data: writes.append(path) or original(path, data),
+    )
+
+    renamed = make_conn("a2", existing.id)
+    new = make_conn("b")
+    saved = manager.bulk_upsert_connections([renamed, new])
+
+    assert len(writes) == 1
+    assert [c.id for c in saved] == [existing.id, existing.id + 1]
+    assert new.id is None
+
+    reloaded = SettingsManager(str(manager._path))
+    assert [(c.id, c.name) for c in reloaded.get_connections()] == [
+        (existing.id, "a2"),
+        (existing.id + 1, "b"),
+    ]
+
+
+def test_bulk_upsert_duplicate_name_changes_nothing(manager):
+    manager.upsert_connection(make_conn("a"))
+    before = manager._path.read_bytes()
+
+    first = make_conn("b")
+    duplicate = make_conn("a")
+    with pytest.raises(ConnectionNameAlreadyExistsError):
+        manager.bulk_upsert_connections([first, duplicate])
+
+    assert first.id is None
+    assert duplicate.id is None
+    assert manager._path.read_bytes() == before
+    assert [c.name for c in manager.get_connections()] == ["a"]
+    assert manager.load_app_settings().next_connection_id == 2
+
+
+def test_connections_are_returned_and_stored_as_copies(manager):
+    payload = make_conn("a")
+    created = manager.upsert_connection(payload)
+    assert payload.id is None
+
+    # Modifying the argument or any returned object leaves the cache alone
+    payload.name = "changed"
+    created.name = "changed"
+    manager.get_connection(created.id).name = "changed"
+    manager.get_connections()[0].name = "changed"
+
+    assert manager.get_connection(created.id).name == "a"
+    assert [c.name for c in manager.get_connections()] == ["a"]
+
+
+def test_cache_reloads_when_file_changes(manager):
+    manager.upsert_connection(make_conn("a"))
+    assert [c.name for c in manager.get_connections()] == ["a"]
+
+    # Size change
+    other = SettingsManager(str(manager._path))
+    other.upsert_connection(make_conn("bb"))
+    assert [c.name for c in manager.get_connections()] == ["a", "bb"]
+
+    # Same size, only mtime differs
+    st = manager._path.stat()
+    raw = manager._path.read_bytes().replace(b'"bb"', b'"cc"')
+    manager._path.write_bytes(raw)
+    os.utime(manager._path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert manager._path.stat().st_size == st.st_size
+    assert [c.name for c in manager.get_connections()] == ["a", "cc"]
+    assert manager.get_connection(2).name == "cc"
+
+
+def test_lookups_do_not_affect_settings_equality(manager):
+    manager.upsert_connection(make_conn("a"))
+    manager.get_connection(1)
+
+    assert manager.load_app_settings() == AppSettings.model_validate_json(manager._path.read_bytes())
+
+
+def test_ids_are_not_reused_after_delete(manager):
+    a = manager.upsert_connection(make_conn("a"))
+    b = manager.upsert_connection(make_conn("b"))
+    assert manager.delete_connection(b.id)
+
+    c = manager.upsert_connection(make_conn("c"))
+    assert c.id == b.id + 1
+
+    # The counter is persisted, so a restarted manager continues from it
+    assert manager.delete_connection(c.id)
+    reloaded = SettingsManager(str(manager._path))
+    d = reloaded.upsert_connection(make_conn("d"))
+    assert d.id == c.id + 1
+    assert [x.id for x in reloaded.get_connections()] == [a.id, d.id]
+
+
+def test_legacy_file_without_next_connection_id_loads(manager):
+    manager._path.write_text(json.dumps({
+        "connections": [
+            {"id": 3, "name": "a", "type": "easy_serial"},
+            {"id": 7, "name": "b", "type": "easy_serial"},
+        ],
+    }))
+
+    assert manager.load_app_settings().next_connection_id == 8
+    assert manager.upsert_connection(make_conn("c")).id == 8
+
+
+def test_stale_next_connection_id_is_bumped(manager):
+    manager._path.write_text(json.dumps({
+        "connections": [{"id": 5, "name": "a", "type": "easy_serial"}],
+        "next_connection_id": 2,
+    }))
+
+    assert manager.load_app_settings().next_connection_id == 6
@@ -0,0 +1,94 @@
+# backend/tests/test_worker_metrics.py
+"""
+Unit tests for BaseConnectionWorker metrics.
+
+Uses a minimal concrete worker (no thread, no I/O) and checks that:
+- counters incremented from several threads add up exactly
+- _set_error() / _log_message() maintain errors_total, messages_total
+  and consecutive_errors together
+- extra metrics declared with _init_extra_metrics() can be both
+  incremented and set, and get_metrics() reports the latest value
+"""
+
+import threading
+from typing import Optional
+
+from backend.app.loggers.base import BaseConnectionWorker
+
+
+class DummyWorker(BaseConnectionWorker):
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        pass
+
+    def is_running(self) -> bool:
+        return False
+
+
+def test_concurrent_increments_are_not_lost():
+    w = DummyWorker()
+    w._init_extra_metrics({"frames_total": 0})
+
+    def work():
+        for _ in range(2000):
+            w._metric_inc("db_writes_total")
+            w._metric_inc("frames_total", extra=True)
+            w._log_message("msg")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    snapshot = w.get_metrics()
+    assert snapshot["metrics"]["db_writes_total"] == 8000
+    assert snapshot["metrics"]["messages_total"] == 8000
+    assert snapshot["extra"]["frames_total"] == 8000
+
+
+def test_errors_and_messages_update_consecutive_errors():
+    w = DummyWorker()
+
+    w._set_error("e1")
+    w._set_error("e2")
+    metrics = w.get_metrics()["metrics"]
+    assert metrics["errors_total"] == 2
+    assert metrics["consecutive_errors"] == 2
+    assert metrics["last_error_at"] is not None
+
+    w._log_message("ok")
+    metrics = w.get_metrics()["metrics"]
+    assert metrics["errors_total"] == 2
+    assert metrics["consecutive_errors"] == 0
+    assert metrics["messages_total"] == 1
+
+    w._set_error("e3")
+    assert w.get_metrics()["metrics"]["consecutive_errors"] == 1
+
+
+def test_get_metrics_reads_are_stable():
+    w = DummyWorker()
+    w._metric_inc("db_write_fail_total", 3)
+
+    # Reading must not change the value
+    for _ in range(3):
+        assert w.get_metrics()["metrics"]["db_write_fail_total"] == 3
+
+
+def test_extra_metric_set_and_inc_share_one_value():
+    w = DummyWorker()
+    w._init_extra_metrics({"packs_total": 0, "mode": "auto"})
+
+    w._metric_inc("packs_total", 5, extra=True)
+    w._metric_set("packs_total", 1, extra=True)
+    w._metric_inc("packs_total", extra=True)
+
+    extra = w.get_metrics()["extra"]
+    assert extra["packs_total"] == 2
+    assert extra["mode"] == "auto"